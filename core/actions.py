@@ -1,24 +1,240 @@
+import atexit
 import ctypes
+import functools
 import os
+import shlex
+import shutil
+import socket
 import subprocess
 import time
-import urllib.parse
-import webbrowser
-from datetime import datetime
+from ctypes import wintypes
+
+# pyperclip / urllib.parse are imported inside the handlers
+# that need them, so a plain url/file hotkey doesn't pay for them
+
+from core.clipboard import read_clipboard_text
+from core.process import find_pids, terminate
+
+# --- IP HELPER API (kill_port) ---
+AF_INET = 2
+AF_INET6 = 23
+TCP_TABLE_OWNER_PID_ALL = 5
+UDP_TABLE_OWNER_PID = 1
+NO_ERROR = 0
+ERROR_INSUFFICIENT_BUFFER = 122
+
+
+class MIB_TCPROW_OWNER_PID(ctypes.Structure):
+    _fields_ = [
+        ("dwState", wintypes.DWORD),
+        ("dwLocalAddr", wintypes.DWORD),
+        ("dwLocalPort", wintypes.DWORD),
+        ("dwRemoteAddr", wintypes.DWORD),
+        ("dwRemotePort", wintypes.DWORD),
+        ("dwOwningPid", wintypes.DWORD),
+    ]
+
+
+class MIB_TCP6ROW_OWNER_PID(ctypes.Structure):
+    _fields_ = [
+        ("ucLocalAddr", ctypes.c_ubyte * 16),
+        ("dwLocalScopeId", wintypes.DWORD),
+        ("dwLocalPort", wintypes.DWORD),
+        ("ucRemoteAddr", ctypes.c_ubyte * 16),
+        ("dwRemoteScopeId", wintypes.DWORD),
+        ("dwRemotePort", wintypes.DWORD),
+        ("dwState", wintypes.DWORD),
+        ("dwOwningPid", wintypes.DWORD),
+    ]
+
+
+class MIB_UDPROW_OWNER_PID(ctypes.Structure):
+    _fields_ = [
+        ("dwLocalAddr", wintypes.DWORD),
+        ("dwLocalPort", wintypes.DWORD),
+        ("dwOwningPid", wintypes.DWORD),
+    ]
+
+
+class MIB_UDP6ROW_OWNER_PID(ctypes.Structure):
+    _fields_ = [
+        ("ucLocalAddr", ctypes.c_ubyte * 16),
+        ("dwLocalScopeId", wintypes.DWORD),
+        ("dwLocalPort", wintypes.DWORD),
+        ("dwOwningPid", wintypes.DWORD),
+    ]
+
+
+_iphlpapi = ctypes.WinDLL("iphlpapi")
+
+# (query function, family, table class, row struct) - mirrors `netstat -aon`
+_PORT_TABLES = (
+    (_iphlpapi.GetExtendedTcpTable, AF_INET, TCP_TABLE_OWNER_PID_ALL, MIB_TCPROW_OWNER_PID),
+    (_iphlpapi.GetExtendedTcpTable, AF_INET6, TCP_TABLE_OWNER_PID_ALL, MIB_TCP6ROW_OWNER_PID),
+    (_iphlpapi.GetExtendedUdpTable, AF_INET, UDP_TABLE_OWNER_PID, MIB_UDPROW_OWNER_PID),
+    (_iphlpapi.GetExtendedUdpTable, AF_INET6, UDP_TABLE_OWNER_PID, MIB_UDP6ROW_OWNER_PID),
+)
+
+
+def _find_pids_on_port(port):
+    """
+    Returns the PIDs owning a local TCP/UDP endpoint on `port`.
+    Reads the kernel tables in-process instead of parsing netstat output.
+    """
+    pids = set()
+
+    for query, family, table_class, row_type in _PORT_TABLES:
+        # First call reports the required size, second call fills the buffer.
+        # Retry in case the table grew between the two calls.
+        size = wintypes.DWORD(0)
+        buf = None
+        ret = query(None, ctypes.byref(size), False, family, table_class, 0)
+        while ret == ERROR_INSUFFICIENT_BUFFER:
+            buf = ctypes.create_string_buffer(size.value)
+            ret = query(buf, ctypes.byref(size), False, family, table_class, 0)
+        if ret != NO_ERROR or buf is None:
+            continue
+
+        # Table layout: DWORD dwNumEntries, followed by the row array
+        count = wintypes.DWORD.from_buffer(buf).value
+        rows = (row_type * count).from_buffer(buf, ctypes.sizeof(wintypes.DWORD))
+        for row in rows:
+            # Port lives in the low 16 bits, network byte order.
+            # PID 0 (System Idle) is never a valid kill target.
+            if socket.ntohs(row.dwLocalPort & 0xFFFF) == port and row.dwOwningPid:
+                pids.add(row.dwOwningPid)
+
+    return pids
+
+
+# --- SHELL (URL launching) ---
+SW_SHOWNORMAL = 1
+
+_shell32 = ctypes.WinDLL("shell32")
+_ShellExecuteW = _shell32.ShellExecuteW
+_ShellExecuteW.argtypes = [
+    wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR,
+    wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_int,
+]
+_ShellExecuteW.restype = wintypes.HINSTANCE
+
+
+def _open_url(url):
+    """Opens a URL with its registered protocol handler (default browser)."""
+    # ShellExecuteW returns a value > 32 on success
+    result = _ShellExecuteW(None, "open", url, None, None, SW_SHOWNORMAL) or 0
+    if result <= 32:
+        print(f"Could not open URL ({result}): {url}")
+
+
+# --- KEYBOARD INPUT (SendInput, no keyboard-hook round trip) ---
+INPUT_KEYBOARD = 1
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+VK_CONTROL = 0x11
+VK_MENU = 0x12  # Alt
+VK_C = 0x43
+VK_V = 0x56
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", wintypes.WPARAM),  # ULONG_PTR
+    ]
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", wintypes.WPARAM),  # ULONG_PTR
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member; it sets sizeof(INPUT)
+    _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+_user32 = ctypes.WinDLL("user32")
+_user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+_user32.SendInput.restype = wintypes.UINT
+_user32.GetForegroundWindow.restype = wintypes.HWND
+_user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+_user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+
+
+def _send_keys(events):
+    """
+    Injects [(vk, flags), ...] as one SendInput batch, so no other
+    input can interleave with it.
+    """
+    inputs = (INPUT * len(events))()
+    for inp, (vk, flags) in zip(inputs, events):
+        inp.type = INPUT_KEYBOARD
+        inp.u.ki.wVk = vk
+        inp.u.ki.dwFlags = flags
+    return _user32.SendInput(len(events), inputs, ctypes.sizeof(INPUT))
+
+
+def _wait_for_foreground_elsewhere(timeout=0.2):
+    """
+    Waits until a window outside this process is focused again
+    (the launcher hides right before pasting), up to `timeout` seconds.
+    """
+    own_pid = os.getpid()
+    pid = wintypes.DWORD()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        hwnd = _user32.GetForegroundWindow()
+        _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        if hwnd and pid.value != own_pid:
+            return
+        time.sleep(0.005)
+
+
+# --- PATHS ---
+DESKTOP_PATH = os.path.expandvars("%USERPROFILE%/Desktop")
+NOTES_PATH = os.path.join(DESKTOP_PATH, "quick_notes.txt")
+
 
-import keyboard
-import pyperclip
+@functools.lru_cache(maxsize=256)
+def _expand(path):
+    """os.path.expandvars, memoized - config paths are fixed per session."""
+    return os.path.expandvars(path)
+
+
+_notes_fh = None
+
+
+def _get_notes_fh():
+    """Opens quick_notes.txt once and keeps the append handle for the session."""
+    global _notes_fh
+    if _notes_fh is None or _notes_fh.closed:
+        _notes_fh = open(NOTES_PATH, "a", buffering=8192, encoding="utf-8")
+        atexit.register(_notes_fh.close)
+    return _notes_fh
 
 
 def save_note(content):
     """Appends text to a notes file on the Desktop"""
     try:
-        desktop = os.path.expandvars("%USERPROFILE%/Desktop")
-        file_path = os.path.join(desktop, "quick_notes.txt")
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        timestamp = time.strftime("%Y-%m-%d %H:%M")
 
-        with open(file_path, "a") as f:
-            f.write(f"[{timestamp}] {content}\n")
+        f = _get_notes_fh()
+        f.write(f"[{timestamp}] {content}\n")
+        f.flush()  # Keep the file current for the "note" (open) command
 
         print(f"Note saved: {content}")
 
@@ -26,145 +242,342 @@ def save_note(content):
         print(f"Error saving note: {e}")
 
 
+# NirCmd lives in the vendor folder (cwd is the app folder, see main.pyw)
+_NIRCMD = os.path.join("vendor", "nircmd.exe")
+
+# nircmd has no UI of its own; never attach a console to it
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW
+
+# Characters that only mean something to cmd.exe (pipes, redirects, %VARS%)
+_SHELL_CHARS = frozenset("&|<>^%")
+
+
+def _needs_shell(command):
+    """
+    True unless `command` is a plain call to an .exe on PATH.
+    Batch files (e.g. VS Code's `code.cmd`), builtins like `start`
+    and pipelines still have to go through cmd.exe.
+    """
+    if _SHELL_CHARS.intersection(command):
+        return True
+    try:
+        parts = shlex.split(command, posix=False)
+    except ValueError:  # e.g. an unbalanced quote: let cmd.exe make sense of it
+        return True
+    if not parts:
+        return True
+    program = shutil.which(parts[0].strip('"'))
+    return not (program and program.lower().endswith(".exe"))
+
+# VK codes for the media_control action
+_MEDIA_KEYS = {
+    "next": 0xB0,  # VK_MEDIA_NEXT_TRACK
+    "prev": 0xB1,  # VK_MEDIA_PREV_TRACK
+    "pause": 0xB3, # VK_MEDIA_PLAY_PAUSE
+    "play": 0xB3,
+}
+
+
+def _init_com():
+    """Hotkeys fire on threads (keyboard hook, RegisterHotKey loop) with no COM apartment yet"""
+    import comtypes
+    try:
+        comtypes.CoInitialize()
+    except OSError:
+        pass  # Already initialized with a different threading model
+
+
+def _endpoint_volume(mic=False):
+    """
+    Returns the IAudioEndpointVolume of the default speakers (or mic),
+    or None when pycaw is missing or Core Audio fails (callers fall back
+    to nircmd).
+    """
+    try:
+        import comtypes
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+    except ImportError:
+        return None
+
+    _init_com()
+
+    try:
+        device = AudioUtilities.GetMicrophone() if mic else AudioUtilities.GetSpeakers()
+        if device is None:
+            return None
+        # Newer pycaw wraps the device in an AudioDevice with the endpoint
+        # ready; older releases return the raw IMMDevice
+        if hasattr(device, "EndpointVolume"):
+            return device.EndpointVolume
+        interface = device.Activate(IAudioEndpointVolume._iid_, comtypes.CLSCTX_ALL, None)
+        return ctypes.cast(interface, ctypes.POINTER(IAudioEndpointVolume))
+    except Exception as e:  # COMError, or an API shape we don't know
+        print(f"Core Audio unavailable: {e}")
+        return None
+
+
+def _toggle_endpoint_mute(mic=False):
+    """Toggles mute through Core Audio. Returns False if unavailable."""
+    endpoint = _endpoint_volume(mic)
+    if endpoint is None:
+        return False
+    try:
+        endpoint.SetMute(not endpoint.GetMute(), None)
+    except Exception as e:
+        print(f"Core Audio mute failed: {e}")
+        return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+#  ACTION HANDLERS - one per action type, signature (value, arg)
+# ---------------------------------------------------------------------------
+
+def _do_sys(value, arg):
+    """1. SYSTEM COMMANDS"""
+    run_system_command(value, arg)
+
+
+def _do_url(value, arg):
+    """2. URL (Websites)"""
+    _open_url(value)
+
+
+def _do_file(value, arg):
+    """3. FILE / FOLDER (Portable Paths)"""
+    os.startfile(_expand(value))
+
+
+def _do_smart_search(value, arg):
+    """4. SMART SEARCH (Hybrid: Manual or Selection)"""
+    # Pass 'arg' so we know if user typed something
+    handle_smart_search(value, arg)
+
+
+def _do_cmd(value, arg):
+    """5. COMMAND LINE / TERMINAL"""
+    # Windows hands the command line to CreateProcess as-is, so a plain
+    # .exe call skips the extra cmd.exe process entirely
+    subprocess.Popen(value, shell=_needs_shell(value))
+
+
+def _do_note(value, arg):
+    """6. NOTES"""
+    if arg:
+        save_note(arg)
+    else:
+        os.startfile(NOTES_PATH)
+
+
+def _do_copy(value, arg):
+    """7. SMART PASTE (Copy + Auto-Paste)"""
+    import pyperclip
+
+    # SetClipboardData is done when copy() returns; only focus has to settle
+    pyperclip.copy(value)
+    _wait_for_foreground_elsewhere()
+    _send_keys([
+        (VK_CONTROL, 0), (VK_V, 0),
+        (VK_V, KEYEVENTF_KEYUP), (VK_CONTROL, KEYEVENTF_KEYUP),
+    ])
+    print(f"Pasted: {value[:10]}...")
+
+
+def _do_kill_port(value, arg):
+    """8. KILL PORT PROCESS (IP Helper, no netstat/taskkill spawns)"""
+    try:
+        port = int(value)
+    except (TypeError, ValueError):
+        print(f"❌ Error clearing port: invalid port {value!r}")
+        return
+    print(f"Scanning port {port}...")
+
+    try:
+        pids = _find_pids_on_port(port)
+
+        if not pids:
+            print(f"ℹ️ Port {port} is already free.")
+            return
+
+        for pid in pids:
+            print(f"Killing PID {pid}...")
+            if not terminate(pid):
+                print(f"Could not terminate PID {pid} (access denied or already gone).")
+
+        print(f"✅ Port {port} successfully cleared.")
+
+    except Exception as e:
+        print(f"❌ Error clearing port: {e}")
+
+
+def _do_audio(value, arg):
+    """9. AUDIO DEVICE SWITCH"""
+    device_name = value
+    print(f"Switching audio to: {device_name}")
+
+    # 'setdefaultsounddevice' sets it for both system sounds and apps
+    subprocess.run([_NIRCMD, "setdefaultsounddevice", device_name], creationflags=_NO_WINDOW)
+
+    print(f"Audio switched to {device_name}")
+
+
+def _do_volume(value, arg):
+    """10. VOLUME CONTROL"""
+    endpoint = _endpoint_volume()
+    try:
+        if endpoint is not None:
+            endpoint.SetMasterVolumeLevelScalar(int(value) / 100, None)
+    except Exception as e:
+        print(f"Core Audio volume failed: {e}")
+        endpoint = None
+    if endpoint is None:
+        # NirCmd scale is 0-65535
+        nircmd_val = int(65535 * int(value) / 100)
+        subprocess.run([_NIRCMD, "setsysvolume", str(nircmd_val)], creationflags=_NO_WINDOW)
+    print(f"Volume set to {value}%")
+
+
+def _do_mute_system(value, arg):
+    """11. SYSTEM MUTE"""
+    if not _toggle_endpoint_mute():
+        # 2 = Toggle
+        subprocess.run([_NIRCMD, "mutesysvolume", "2"], creationflags=_NO_WINDOW)
+    print("System audio toggled.")
+
+
+def _do_mute_mic(value, arg):
+    """12. MIC MUTE (The Hackathon Lifesaver)"""
+    if not _toggle_endpoint_mute(mic=True):
+        # "default_record" targets your main mic
+        subprocess.run([_NIRCMD, "mutesysvolume", "2", "default_record"], creationflags=_NO_WINDOW)
+    print("Microphone toggled.")
+
+
+def _do_mute_app(value, arg):
+    """13. APP MUTE (Target specific process)"""
+    app_name = value if value.endswith(".exe") else f"{value}.exe"
+
+    target = app_name.lower()
+    found = False
+    try:
+        from pycaw.pycaw import AudioUtilities
+        _init_com()
+        for session in AudioUtilities.GetAllSessions():
+            if session.Process and session.Process.name().lower() == target:
+                volume = session.SimpleAudioVolume
+                volume.SetMute(not volume.GetMute(), None)
+                found = True
+    except Exception as e:  # No pycaw, or Core Audio failed (COMError, ...)
+        if not isinstance(e, ImportError):
+            print(f"Core Audio app mute failed: {e}")
+        if found:
+            return  # Some sessions already toggled: nircmd would flip them back
+        # muteappvolume requires process name and 1 (mute), 0 (unmute), or 2 (toggle)
+        subprocess.run([_NIRCMD, "muteappvolume", app_name, "2"], creationflags=_NO_WINDOW)
+        print(f"Toggled mute for {app_name}")
+        return
+
+    if found:
+        print(f"Toggled mute for {app_name}")
+    else:
+        print(f"No audio session found for {app_name}")
+
+
+def _do_media_control(value, arg):
+    """14. MEDIA KEYS"""
+    key_code = _MEDIA_KEYS.get(value)
+    if key_code:
+        _send_keys([
+            (key_code, KEYEVENTF_EXTENDEDKEY),
+            (key_code, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP),
+        ])
+
+
+# Built once at import: action type -> handler
+_ACTION_HANDLERS = {
+    "sys": _do_sys,
+    "url": _do_url,
+    "file": _do_file,
+    "folder": _do_file,
+    "smart_search": _do_smart_search,
+    "cmd": _do_cmd,
+    "exec": _do_cmd,
+    "note": _do_note,
+    "copy": _do_copy,
+    "kill_port": _do_kill_port,
+    "audio": _do_audio,
+    "volume": _do_volume,
+    "mute_system": _do_mute_system,
+    "mute_mic": _do_mute_mic,
+    "mute_app": _do_mute_app,
+    "media_control": _do_media_control,
+}
+
+
 def execute_action(action):
     """
     Main entry point to execute commands.
     """
-    action_type = action.get("type")
-    value = action.get("value")
+    handler = _ACTION_HANDLERS.get(action.get("type"))
+    if handler is None:
+        return
 
     # Retrieve the argument (e.g., "chrome" from "kill chrome")
     arg = action.get("search_term", "")
 
     try:
-        # 1. SYSTEM COMMANDS
-        if action_type == "sys":
-            run_system_command(value, arg)
-
-        # 2. URL (Websites)
-        elif action_type == "url":
-            webbrowser.open(value)
-
-        # 3. FILE / FOLDER (Portable Paths)
-        elif action_type == "file" or action_type == "folder":
-            expanded_path = os.path.expandvars(value)
-            os.startfile(expanded_path)
-
-        # 4. SMART SEARCH (Hybrid: Manual or Selection)
-        elif action_type == "smart_search":
-            # Pass 'arg' so we know if user typed something
-            handle_smart_search(value, arg)
-
-        # 5. COMMAND LINE / TERMINAL
-        elif action_type == "cmd" or action_type == "exec":
-            subprocess.Popen(value, shell=True)
-
-        # 6. NOTES
-        elif action_type == "note":
-            if arg:
-                save_note(arg)
-            else:
-                desktop = os.path.expandvars("%USERPROFILE%/Desktop")
-                os.startfile(os.path.join(desktop, "quick_notes.txt"))
-
-        # 7. SMART PASTE (Copy + Auto-Paste)
-        elif action_type == "copy":
-            pyperclip.copy(value)
-            time.sleep(0.2)
-            keyboard.send("ctrl+v")
-            print(f"Pasted: {value[:10]}...")
-
-        # 8. KILL PORT PROCESS (New Feature)
-        # 8. KILL PORT PROCESS (Robust Version)
-        elif action_type == "kill_port":
-            port = value
-            print(f"Scanning port {port}...")
-            
-            try:
-                # 1. Get all connections on the port
-                # We use check_output to get the text result of netstat
-                output = subprocess.check_output(f"netstat -aon | findstr :{port}", shell=True).decode()
-                
-                # 2. Extract unique PIDs
-                pids = set()
-                for line in output.strip().split("\n"):
-                    parts = line.strip().split()
-                    # PID is usually the last column (index 4 or -1)
-                    if len(parts) >= 5:
-                        pid = parts[-1]
-                        if pid.isdigit() and pid != "0": # Ignore System process (0)
-                            pids.add(pid)
-                
-                if not pids:
-                    print(f"No active process found on port {port}.")
-                    return
-
-                # 3. Kill each unique PID once
-                for pid in pids:
-                    print(f"Killing PID {pid}...")
-                    # Capture output to prevent "Process not found" spam
-                    subprocess.run(f"taskkill /f /pid {pid}", shell=True, capture_output=True)
-                
-                print(f"✅ Port {port} successfully cleared.")
-
-            except subprocess.CalledProcessError:
-                # subprocess raises this if 'findstr' finds nothing (exit code 1)
-                print(f"ℹ️ Port {port} is already free.")
-            except Exception as e:
-                print(f"❌ Error clearing port: {e}")
-        elif action_type == "audio":
-            device_name = value
-            print(f"Switching audio to: {device_name}")
-            
-            # Use nircmd from the vendor folder
-            # 'setdefaultsounddevice' sets it for both system sounds and apps
-            cmd = f'vendor\\nircmd.exe setdefaultsounddevice "{device_name}"'
-            
-            subprocess.run(cmd, shell=True)
-            
-            # Optional: Visual confirmation via print or you could play a beep
-            print(f"Audio switched to {device_name}")
-    # 9. VOLUME CONTROL
-        elif action_type == "volume":
-            # NirCmd scale is 0-65535
-            nircmd_val = int(65535 * int(value) / 100)
-            subprocess.run(f'vendor\\nircmd.exe setsysvolume {nircmd_val}', shell=True)
-            print(f"Volume set to {value}%")
-
-        # 10. SYSTEM MUTE
-        elif action_type == "mute_system":
-            # 2 = Toggle
-            subprocess.run('vendor\\nircmd.exe mutesysvolume 2', shell=True)
-            print("System audio toggled.")
-
-        # 11. MIC MUTE (The Hackathon Lifesaver)
-        elif action_type == "mute_mic":
-            # "default_record" targets your main mic
-            subprocess.run('vendor\\nircmd.exe mutesysvolume 2 "default_record"', shell=True)
-            print("Microphone toggled.")
-
-        # 12. APP MUTE (Target specific process)
-        elif action_type == "mute_app":
-            app_name = value if value.endswith(".exe") else f"{value}.exe"
-            # muteappvolume requires process name and 1 (mute), 0 (unmute), or 2 (toggle)
-            subprocess.run(f'vendor\\nircmd.exe muteappvolume "{app_name}" 2', shell=True)
-            print(f"Toggled mute for {app_name}")
-
-        # 13. MEDIA KEYS
-        elif action_type == "media_control":
-            key_map = {
-                "next": "0xB0",  # VK_MEDIA_NEXT_TRACK
-                "prev": "0xB1",  # VK_MEDIA_PREV_TRACK
-                "pause": "0xB3", # VK_MEDIA_PLAY_PAUSE
-                "play": "0xB3"
-            }
-            if value in key_map:
-                key_code = key_map[value]
-                subprocess.run(f'vendor\\nircmd.exe sendkeypress {key_code}', shell=True)
+        handler(action.get("value"), arg)
     except Exception as e:
         print(f"General Execution Error: {e}")
-        
-        
+
+
+# --- POWER (shutdown / sleep without cmd.exe) ---
+TOKEN_ADJUST_PRIVILEGES = 0x0020
+TOKEN_QUERY = 0x0008
+SE_PRIVILEGE_ENABLED = 0x00000002
+SHTDN_REASON_MAJOR_OTHER = 0x00000000
+SHTDN_REASON_FLAG_PLANNED = 0x80000000
+
+
+class LUID(ctypes.Structure):
+    _fields_ = [("LowPart", wintypes.DWORD), ("HighPart", wintypes.LONG)]
+
+
+class LUID_AND_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [("Luid", LUID), ("Attributes", wintypes.DWORD)]
+
+
+class TOKEN_PRIVILEGES(ctypes.Structure):
+    _fields_ = [
+        ("PrivilegeCount", wintypes.DWORD),
+        ("Privileges", LUID_AND_ATTRIBUTES * 1),
+    ]
+
+
+def _enable_shutdown_privilege():
+    """Shutdown and suspend both require SeShutdownPrivilege on our token."""
+    advapi32 = ctypes.windll.advapi32
+    token = wintypes.HANDLE()
+    if not advapi32.OpenProcessToken(
+        ctypes.windll.kernel32.GetCurrentProcess(),
+        TOKEN_ADJUST_PRIVILEGES | TOKEN_QUERY,
+        ctypes.byref(token),
+    ):
+        return False
+
+    try:
+        tp = TOKEN_PRIVILEGES()
+        tp.PrivilegeCount = 1
+        tp.Privileges[0].Attributes = SE_PRIVILEGE_ENABLED
+        if not advapi32.LookupPrivilegeValueW(
+            None, "SeShutdownPrivilege", ctypes.byref(tp.Privileges[0].Luid)
+        ):
+            return False
+        return bool(advapi32.AdjustTokenPrivileges(
+            token, False, ctypes.byref(tp), 0, None, None
+        ))
+    finally:
+        ctypes.windll.kernel32.CloseHandle(token)
 
 
 def run_system_command(cmd, arg=""):
@@ -175,10 +588,17 @@ def run_system_command(cmd, arg=""):
         ctypes.windll.user32.LockWorkStation()
 
     elif cmd == "shutdown":
-        os.system("shutdown /s /t 0")
+        # Same as `shutdown /s /t 0`: no delay, apps are not force-closed
+        _enable_shutdown_privilege()
+        ctypes.windll.advapi32.InitiateSystemShutdownExW(
+            None, None, 0, False, False,
+            SHTDN_REASON_MAJOR_OTHER | SHTDN_REASON_FLAG_PLANNED,
+        )
 
     elif cmd == "sleep":
-        os.system("rundll32.exe powrprof.dll,SetSuspendState 0,1,0")
+        # Hibernate=False, ForceCritical=True, DisableWakeEvent=False
+        _enable_shutdown_privilege()
+        ctypes.windll.powrprof.SetSuspendState(False, True, False)
 
     elif cmd == "empty_bin":
         try:
@@ -189,8 +609,16 @@ def run_system_command(cmd, arg=""):
 
     elif cmd == "kill":
         if arg:
-            print(f"Killing {arg}...")
-            os.system(f"taskkill /f /im {arg}.exe")
+            exe_name = arg if arg.lower().endswith(".exe") else f"{arg}.exe"
+            print(f"Killing {exe_name}...")
+            for pid in find_pids(exe_name):
+                terminate(pid)
+
+
+@functools.lru_cache(maxsize=64)
+def _takes_query(base_url):
+    """True for search-engine templates ('...?q='), False for clean homepages."""
+    return "?" in base_url or "=" in base_url
 
 
 def handle_smart_search(base_url, manual_query=""):
@@ -199,54 +627,44 @@ def handle_smart_search(base_url, manual_query=""):
     1. If user typed text ('gs hello'), search immediately.
     2. If user typed nothing ('gs'), copy selected text and search.
     """
+    from urllib.parse import quote
+
     try:
         # --- CASE A: Manual Typing (gs hello) ---
         if manual_query:
-            # If URL supports queries (Google/Perplexity Search)
-            if base_url.endswith("=") or "?" in base_url:
-                encoded_text = urllib.parse.quote(manual_query)
-                webbrowser.open_new(f"{base_url}{encoded_text}")
-            # If Clean URL (Gemini Home/ChatGPT Home)
-            else:
-                # We can't force text into homepages, so just open them
-                webbrowser.open_new(base_url)
-            return
+            text = manual_query
 
         # --- CASE B: Smart Selection (gs) ---
-        pyperclip.copy("")  # Clear clipboard
-
-        # Release modifiers to prevent stuck keys
-        keyboard.release("alt")
-        keyboard.release("ctrl")
-        time.sleep(0.05)
-
-        # Human-like 'Ctrl+C'
-        keyboard.press("ctrl")
-        keyboard.send("c")
-        time.sleep(0.1)
-        keyboard.release("ctrl")
-
-        # Wait for text
-        selected_text = ""
-        for _ in range(10):
-            time.sleep(0.05)
-            selected_text = pyperclip.paste().strip()
-            if selected_text:
-                break
+        else:
+            # The sequence number bumps on every clipboard write, so we can
+            # tell whether Ctrl+C copied anything without clearing the clipboard
+            seq_before = _user32.GetClipboardSequenceNumber()
+
+            # Release the hotkey's modifiers (prevents stuck keys), then
+            # Ctrl+C - one atomic batch
+            _send_keys([
+                (VK_MENU, KEYEVENTF_KEYUP), (VK_CONTROL, KEYEVENTF_KEYUP),
+                (VK_CONTROL, 0), (VK_C, 0),
+                (VK_C, KEYEVENTF_KEYUP), (VK_CONTROL, KEYEVENTF_KEYUP),
+            ])
+
+            # Wait for the copy: poll the cheap counter, read the clipboard once
+            text = ""
+            for _ in range(50):
+                if _user32.GetClipboardSequenceNumber() != seq_before:
+                    text = read_clipboard_text().strip()
+                    break
+                time.sleep(0.01)
 
         # Logic: Google vs AI Homepages
         # If it's a search engine, we add the text to the URL.
-        if "?" in base_url or "=" in base_url:
-            if selected_text:
-                encoded_text = urllib.parse.quote(selected_text)
-                webbrowser.open_new(f"{base_url}{encoded_text}")
-            else:
-                webbrowser.open_new(base_url)
+        if text and _takes_query(base_url):
+            _open_url(f"{base_url}{quote(text)}")
         # If it's an AI homepage (Clean URL), we just open it.
         # User can Paste manually (Ctrl+V) since text is in clipboard.
         else:
-            webbrowser.open_new(base_url)
+            _open_url(base_url)
 
     except Exception as e:
         print(f"Smart Search Error: {e}")
-        webbrowser.open(base_url)
\ No newline at end of file
+        _open_url(base_url)
@@ -1,14 +1,120 @@
+import ctypes
 import threading
+from collections import OrderedDict
 import time
+from ctypes import wintypes
 
-import pyperclip
+# --- WIN32 CLIPBOARD LISTENER ---
+WM_CLIPBOARDUPDATE = 0x031D
+CF_UNICODETEXT = 13
+HWND_MESSAGE = -3
+
+# Bigger text (e.g. a whole copied source file) is not kept in history
+MAX_TEXT_BYTES = 1024 * 1024
+
+LRESULT = wintypes.LPARAM
+WNDPROC = ctypes.WINFUNCTYPE(
+    LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+)
+
+
+class WNDCLASSW(ctypes.Structure):
+    _fields_ = [
+        ("style", wintypes.UINT),
+        ("lpfnWndProc", WNDPROC),
+        ("cbClsExtra", ctypes.c_int),
+        ("cbWndExtra", ctypes.c_int),
+        ("hInstance", wintypes.HINSTANCE),
+        ("hIcon", wintypes.HICON),
+        ("hCursor", wintypes.HANDLE),
+        ("hbrBackground", wintypes.HBRUSH),
+        ("lpszMenuName", wintypes.LPCWSTR),
+        ("lpszClassName", wintypes.LPCWSTR),
+    ]
+
+
+_user32 = ctypes.WinDLL("user32")
+_kernel32 = ctypes.WinDLL("kernel32")
+
+_user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+_user32.DefWindowProcW.restype = LRESULT
+_user32.RegisterClassW.argtypes = [ctypes.POINTER(WNDCLASSW)]
+_user32.RegisterClassW.restype = wintypes.ATOM
+_user32.CreateWindowExW.argtypes = [
+    wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+    ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+    wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+]
+_user32.CreateWindowExW.restype = wintypes.HWND
+_user32.AddClipboardFormatListener.argtypes = [wintypes.HWND]
+_user32.AddClipboardFormatListener.restype = wintypes.BOOL
+_user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+_user32.GetMessageW.restype = wintypes.BOOL
+_user32.TranslateMessage.argtypes = [ctypes.POINTER(wintypes.MSG)]
+_user32.DispatchMessageW.argtypes = [ctypes.POINTER(wintypes.MSG)]
+_user32.DispatchMessageW.restype = LRESULT
+_user32.OpenClipboard.argtypes = [wintypes.HWND]
+_user32.OpenClipboard.restype = wintypes.BOOL
+_user32.CloseClipboard.restype = wintypes.BOOL
+_user32.GetClipboardData.argtypes = [wintypes.UINT]
+_user32.GetClipboardData.restype = wintypes.HANDLE
+_user32.IsClipboardFormatAvailable.argtypes = [wintypes.UINT]
+_user32.IsClipboardFormatAvailable.restype = wintypes.BOOL
+_user32.GetClipboardSequenceNumber.restype = wintypes.DWORD
+_kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+_kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+_kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+_kernel32.GlobalLock.restype = wintypes.LPVOID
+_kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+_kernel32.GlobalUnlock.restype = wintypes.BOOL
+_kernel32.GlobalSize.argtypes = [wintypes.HGLOBAL]
+_kernel32.GlobalSize.restype = ctypes.c_size_t
+
+
+def read_clipboard_text(hwnd=None, retries=5, max_bytes=None):
+    """
+    Reads CF_UNICODETEXT from the clipboard, or "" if unavailable.
+    With `max_bytes`, larger payloads are skipped without being copied.
+    """
+    # Images, files, etc: nothing to read, don't even open the clipboard
+    if not _user32.IsClipboardFormatAvailable(CF_UNICODETEXT):
+        return ""
+
+    # Another app may still hold the clipboard right after it changed
+    for _ in range(retries):
+        if _user32.OpenClipboard(hwnd):
+            break
+        time.sleep(0.01)
+    else:
+        return ""
+
+    try:
+        handle = _user32.GetClipboardData(CF_UNICODETEXT)
+        if not handle:
+            return ""
+        if max_bytes is not None and _kernel32.GlobalSize(handle) > max_bytes:
+            return ""
+        ptr = _kernel32.GlobalLock(handle)
+        if not ptr:
+            return ""
+        try:
+            return ctypes.wstring_at(ptr)
+        finally:
+            _kernel32.GlobalUnlock(handle)
+    finally:
+        _user32.CloseClipboard()
 
 
 class ClipboardManager:
     def __init__(self, max_items=20):
-        self.history = []
+        # Keys are the entries, newest first. Values are unused.
+        self.history = OrderedDict()
+        self._lock = threading.Lock()
         self.max_items = max_items
+        # Bumped on every history change so readers can cache derived views
+        self.version = 0
         self.last_text = ""
+        self._last_seq = None
 
         # Start the listener in a background thread
         # daemon=True means it dies when the main app closes
@@ -16,38 +122,72 @@ class ClipboardManager:
         self.thread.start()
 
     def monitor_clipboard(self):
-        """Checks every 0.5s if the clipboard content changed"""
-        while True:
-            try:
-                # Get current clipboard content
-                current_text = pyperclip.paste()
-
-                # If it's valid text and different from the last thing we saw
-                if (
-                    current_text
-                    and current_text.strip()
-                    and current_text != self.last_text
-                ):
-                    self.last_text = current_text
-                    self.add_to_history(current_text)
-
-            except Exception as e:
-                print(f"Clipboard Error: {e}")
-
-            # Sleep to save CPU
-            time.sleep(0.5)
+        """
+        Waits for WM_CLIPBOARDUPDATE on a hidden message-only window.
+        No polling: the thread sleeps inside GetMessageW until the clipboard changes.
+        """
+        # Keep a reference to the callback, otherwise ctypes frees it
+        self._wndproc = WNDPROC(self._wnd_proc)
 
-    def add_to_history(self, text):
-        # Remove duplicates if they exist (move to top)
-        if text in self.history:
-            self.history.remove(text)
+        h_instance = _kernel32.GetModuleHandleW(None)
+        wc = WNDCLASSW()
+        wc.lpfnWndProc = self._wndproc
+        wc.hInstance = h_instance
+        wc.lpszClassName = "SynapseClipboardListener"
+        _user32.RegisterClassW(ctypes.byref(wc))
+
+        self.hwnd = _user32.CreateWindowExW(
+            0, wc.lpszClassName, None, 0, 0, 0, 0, 0,
+            HWND_MESSAGE, None, h_instance, None,
+        )
+        if not self.hwnd or not _user32.AddClipboardFormatListener(self.hwnd):
+            print("Clipboard Error: could not register clipboard listener")
+            return
+
+        msg = wintypes.MSG()
+        while _user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            _user32.TranslateMessage(ctypes.byref(msg))
+            _user32.DispatchMessageW(ctypes.byref(msg))
+
+    def _wnd_proc(self, hwnd, msg, wparam, lparam):
+        if msg == WM_CLIPBOARDUPDATE:
+            self.on_clipboard_update()
+            return 0
+        return _user32.DefWindowProcW(hwnd, msg, wparam, lparam)
 
-        # Add to the front (Top of the list)
-        self.history.insert(0, text)
+    def on_clipboard_update(self):
+        # Some apps write several formats in a row; one read per change is enough
+        seq = _user32.GetClipboardSequenceNumber()
+        if seq == self._last_seq:
+            return
+        self._last_seq = seq
+
+        try:
+            current_text = read_clipboard_text(self.hwnd, max_bytes=MAX_TEXT_BYTES)
+
+            # If it's valid text and different from the last thing we saw
+            if (
+                current_text
+                and current_text.strip()
+                and current_text != self.last_text
+            ):
+                self.last_text = current_text
+                self.add_to_history(current_text)
+
+        except Exception as e:
+            print(f"Clipboard Error: {e}")
+
+    def add_to_history(self, text):
+        with self._lock:
+            # Insert (or re-insert a duplicate) and move it to the top - O(1)
+            self.history[text] = None
+            self.history.move_to_end(text, last=False)
 
-        # Keep list size manageable
-        if len(self.history) > self.max_items:
-            self.history.pop()
+            # Keep list size manageable
+            while len(self.history) > self.max_items:
+                self.history.popitem(last=True)
+            self.version += 1
 
     def get_history(self):
-        return self.history
+        with self._lock:
+            return list(self.history)
@@ -1,10 +1,52 @@
+import ctypes
 import os
 import subprocess
 import sys  # <--- Make sure sys is imported!
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import wintypes
+
+from core.process import is_running
+
+# --- EVERYTHING SDK (IPC DLL) ---
+EVERYTHING_OK = 0
+EVERYTHING_SORT_RUN_COUNT_DESCENDING = 20
+
+# Same exclusions es.exe used to receive as extra arguments
+SEARCH_FILTERS = " !node_modules !$Recycle.Bin !Windows\\Installer"
+
+
+def _load_sdk(dll_path):
+    """Loads the Everything IPC DLL and declares its prototypes, or returns None."""
+    if not os.path.exists(dll_path):
+        return None
+    try:
+        sdk = ctypes.WinDLL(dll_path)
+    except OSError as e:
+        print(f"Everything SDK unavailable: {e}")
+        return None
+
+    sdk.Everything_SetSearchW.argtypes = [wintypes.LPCWSTR]
+    sdk.Everything_SetMax.argtypes = [wintypes.DWORD]
+    sdk.Everything_SetSort.argtypes = [wintypes.DWORD]
+    sdk.Everything_QueryW.argtypes = [wintypes.BOOL]
+    sdk.Everything_QueryW.restype = wintypes.BOOL
+    sdk.Everything_GetNumResults.restype = wintypes.DWORD
+    sdk.Everything_GetLastError.restype = wintypes.DWORD
+    sdk.Everything_GetResultFullPathNameW.argtypes = [
+        wintypes.DWORD, wintypes.LPWSTR, wintypes.DWORD
+    ]
+    sdk.Everything_GetResultFullPathNameW.restype = wintypes.DWORD
+    sdk.Everything_IsFolderResult.argtypes = [wintypes.DWORD]
+    sdk.Everything_IsFolderResult.restype = wintypes.BOOL
+    return sdk
 
 
 class EverythingManager:
+    # Windows-specific startup flags to hide the console window (built once)
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+
     def __init__(self):
         # --- PATH FIX START ---
         if getattr(sys, "frozen", False):
@@ -18,26 +60,95 @@ class EverythingManager:
 
         self.es_path = os.path.join(base_path, "vendor", "es.exe")
         self.exe_path = os.path.join(base_path, "vendor", "Everything.exe")
+        dll_name = "Everything64.dll" if sys.maxsize > 2**32 else "Everything32.dll"
+        self.dll_path = os.path.join(base_path, "vendor", dll_name)
         # --- PATH FIX END ---
 
         self.current_process = None
 
+        # One worker: searches run in order off the UI thread (see search_async)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="everything")
+        self._pending = None
+
+        # Query in-process over IPC when the SDK DLL ships next to es.exe.
+        # The SDK keeps global query state, so calls are serialized.
+        self.sdk = _load_sdk(self.dll_path)
+        self._sdk_lock = threading.Lock()
+        self._path_buf = ctypes.create_unicode_buffer(32768)
+
         # Start engine silently if needed
         threading.Thread(target=self.ensure_running, daemon=True).start()
 
     def ensure_running(self):
         try:
-            output = subprocess.check_output("tasklist", shell=True).decode()
-            if "Everything.exe" not in output:
+            if not is_running("Everything.exe"):
                 if os.path.exists(self.exe_path):
                     subprocess.Popen([self.exe_path, "-startup"])
         except:
             pass
 
+    def search_async(self, query, limit=100):
+        """
+        Runs `search` on the worker thread and returns its Future.
+        A newer call supersedes the previous one (see cancel_pending).
+        """
+        self.cancel_pending()
+        self._pending = self._executor.submit(self.search, query, limit)
+        return self._pending
+
+    def cancel_pending(self):
+        """Cancels a queued search, or kills a running es.exe so the worker frees up."""
+        if self._pending is not None and not self._pending.cancel():
+            process = self.current_process
+            if process and process.poll() is None:
+                try:
+                    process.kill()
+                except:
+                    pass
+        self._pending = None
+
     def search(self, query, limit=100):
+        """Blocking search. Prefer search_async from the UI thread."""
         if not query:
             return []
 
+        if self.sdk is not None:
+            found = self._search_sdk(query, limit)
+            if found is not None:
+                paths, folders = found
+                return self._to_results(paths, folders)
+
+        # No DLL, or the IPC query failed (engine still starting): use es.exe
+        return self._to_results(self._search_es(query, limit))
+
+    def _search_sdk(self, query, limit):
+        """Returns (full paths, is-folder flags) via the Everything IPC API, or None on failure."""
+        sdk = self.sdk
+        buf = self._path_buf
+        with self._sdk_lock:
+            try:
+                sdk.Everything_SetSearchW(query + SEARCH_FILTERS)
+                sdk.Everything_SetMax(limit)
+                sdk.Everything_SetSort(EVERYTHING_SORT_RUN_COUNT_DESCENDING)
+
+                if not sdk.Everything_QueryW(True):
+                    print(f"Everything IPC error: {sdk.Everything_GetLastError()}")
+                    return None
+
+                paths = []
+                folders = []
+                for i in range(sdk.Everything_GetNumResults()):
+                    if sdk.Everything_GetResultFullPathNameW(i, buf, len(buf)):
+                        paths.append(buf.value)
+                        folders.append(bool(sdk.Everything_IsFolderResult(i)))
+                return paths, folders
+
+            except Exception as e:
+                print(f"Search Crash: {e}")
+                return None
+
+    def _search_es(self, query, limit):
+        """Returns full paths by running es.exe (one process per query)."""
         # Debounce
         if self.current_process and self.current_process.poll() is None:
             try:
@@ -58,11 +169,7 @@ class EverythingManager:
             ]
 
             # Basic Filters
-            cmd += ["!node_modules", "!$Recycle.Bin", "!Windows\\Installer"]
-
-            # Windows-specific startup flags to hide the console window
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            cmd += SEARCH_FILTERS.split()
 
             self.current_process = subprocess.Popen(
                 cmd,
@@ -71,25 +178,28 @@ class EverythingManager:
                 text=True,
                 encoding="utf-8",
                 errors="replace",  # Prevents crashes on weird filenames
-                startupinfo=startupinfo,
+                startupinfo=self._STARTUPINFO,
+                creationflags=subprocess.CREATE_NO_WINDOW,  # No conhost at all
             )
 
             stdout, _ = self.current_process.communicate()
 
-            results = []
-            if stdout:
-                lines = stdout.strip().split("\n")
-                for line in lines:
-                    if line.strip():
-                        full_path = line.strip()
-                        filename = os.path.basename(full_path)
-
-                        # Just append results (Sorting happens in Python/Launcher now)
-                        results.append(
-                            {"label": filename, "value": full_path, "type": "file"}
-                        )
-            return results
+            if not stdout:
+                return []
+            return [line.strip() for line in stdout.split("\n") if line.strip()]
 
         except Exception as e:
             print(f"Search Crash: {e}")
             return []
+
+    def _to_results(self, paths, folders=None):
+        # Just build results (Sorting happens in Python/Launcher now)
+        results = [
+            {"label": os.path.basename(full_path), "value": full_path, "type": "file"}
+            for full_path in paths
+        ]
+        # es.exe output carries no type info; the launcher falls back to a string check
+        if folders is not None:
+            for res, is_folder in zip(results, folders):
+                res["is_folder"] = is_folder
+        return results
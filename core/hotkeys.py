@@ -1,7 +1,109 @@
+import ctypes
+import threading
+from ctypes import wintypes
+from functools import partial
+
 import keyboard
 
 from core.actions import execute_action
 
+# --- WIN32 HOTKEYS ---
+WM_HOTKEY = 0x0312
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+MOD_NOREPEAT = 0x4000  # Holding the combo fires once, not on auto-repeat
+
+_MODIFIERS = {
+    "alt": MOD_ALT,
+    "ctrl": MOD_CONTROL,
+    "control": MOD_CONTROL,
+    "shift": MOD_SHIFT,
+    "win": MOD_WIN,
+    "windows": MOD_WIN,
+}
+
+_NAMED_KEYS = {
+    "space": 0x20,
+    "enter": 0x0D,
+    "return": 0x0D,
+    "tab": 0x09,
+    "esc": 0x1B,
+    "escape": 0x1B,
+    "backspace": 0x08,
+    "insert": 0x2D,
+    "delete": 0x2E,
+    "home": 0x24,
+    "end": 0x23,
+    "page up": 0x21,
+    "page down": 0x22,
+    "left": 0x25,
+    "up": 0x26,
+    "right": 0x27,
+    "down": 0x28,
+    **{f"f{i}": 0x6F + i for i in range(1, 25)},  # VK_F1 = 0x70
+}
+
+_user32 = ctypes.WinDLL("user32")
+_user32.RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+_user32.RegisterHotKey.restype = wintypes.BOOL
+_user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+_user32.GetMessageW.restype = wintypes.BOOL
+
+
+def parse_hotkey(key_combo):
+    """
+    Converts a `keyboard`-style combo ("alt+g", "ctrl+shift+f5") into
+    (modifiers, vk) for RegisterHotKey, or None if it can't be expressed.
+    """
+    *mods, key = [part.strip().lower() for part in key_combo.split("+")]
+
+    modifiers = 0
+    for mod in mods:
+        if mod not in _MODIFIERS:
+            return None
+        modifiers |= _MODIFIERS[mod]
+
+    if len(key) == 1 and key.isalnum():
+        vk = ord(key.upper())  # VK codes for 0-9 / A-Z match ASCII
+    elif key in _NAMED_KEYS:
+        vk = _NAMED_KEYS[key]
+    else:
+        return None
+
+    return modifiers, vk
+
+
+def _hotkey_loop(hotkeys, ready):
+    """
+    Registers every hotkey on this thread and pumps WM_HOTKEY messages.
+    The OS only wakes us for matching combos - no per-keystroke Python hook.
+    """
+    table = {}  # hotkey id -> prebuilt callable
+
+    for hotkey_id, (key_combo, action_data) in enumerate(hotkeys.items(), start=1):
+        # partial binds this combo's action now (no late-binding closure)
+        callback = partial(execute_action, action_data)
+        parsed = parse_hotkey(key_combo)
+        # hwnd=None binds the hotkey to this thread's message queue
+        if parsed and _user32.RegisterHotKey(None, hotkey_id, parsed[0] | MOD_NOREPEAT, parsed[1]):
+            table[hotkey_id] = callback
+            print(f"[+] Registered: {key_combo}")
+        else:
+            # Unsupported key name or combo already taken: use the keyboard hook
+            keyboard.add_hotkey(key_combo, callback)
+            print(f"[+] Registered (hook): {key_combo}")
+
+    ready.set()
+
+    msg = wintypes.MSG()
+    while _user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+        if msg.message == WM_HOTKEY:
+            callback = table.get(msg.wParam)
+            if callback is not None:
+                callback()
+
 
 def register_hotkeys(config):
     """
@@ -11,10 +113,10 @@ def register_hotkeys(config):
 
     print("--- Registering Shortcuts ---")
 
-    for key_combo, action_data in hotkeys.items():
-        # We use a lambda to pass specific data to the handler
-        # suppress=True prevents the keystroke from sending to other apps (optional)
-        keyboard.add_hotkey(key_combo, lambda d=action_data: execute_action(d))
-        print(f"[+] Registered: {key_combo}")
+    # RegisterHotKey delivers to the registering thread, so registration
+    # and the message loop share one daemon thread
+    ready = threading.Event()
+    threading.Thread(target=_hotkey_loop, args=(hotkeys, ready), daemon=True).start()
+    ready.wait(timeout=2)
 
     print("---------------------------")
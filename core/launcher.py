@@ -1,25 +1,31 @@
+import ast
+import functools
+import math
+import operator
 import os
+from collections import OrderedDict
 import sys
 import re
 import subprocess
-import pyperclip
-import webbrowser
 
 from PyQt6.QtCore import (
     Qt, QTimer, pyqtSignal, QObject, QEvent, QPoint,
-    QPropertyAnimation, QEasingCurve, QSettings, QSize
+    QVariantAnimation, QSettings, QSize, QRectF, QPointF,
+    QAbstractListModel, QModelIndex
 )
 from PyQt6.QtGui import (
-    QFont, QKeySequence, QShortcut, QColor, QGuiApplication
+    QFont, QFontMetrics, QKeySequence, QShortcut, QColor, QGuiApplication,
+    QImage, QLinearGradient, QPainter, QPixmap, QStaticText, QTransform
 )
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QScrollArea, QFrame, QGraphicsDropShadowEffect,
-    QGraphicsOpacityEffect, QSizePolicy, QSpacerItem
+    QLineEdit, QListView, QFrame, QStyle, QStyledItemDelegate,
+    QAbstractItemView
 )
 
 # Assumed internal modules (kept as is)
-from core.snipper import Snipper
+# core.snipper (winsdk) is imported on first "ocr" use,
+# pyperclip / webbrowser inside the handlers that need them
 from core.actions import execute_action
 from core.clipboard import ClipboardManager
 from core.everything import EverythingManager
@@ -34,51 +40,124 @@ ITEM_SPACING = 2
 HEADER_HEIGHT = 24  # FIXED: Reduced from 28 for tighter spacing
 CONTENT_PADDING = 8
 SHORTCUT_WIDTH = 58
+SEARCH_CACHE_SIZE = 128  # Ready-to-render result lists kept per launcher session
 
+# Command words checked on every keystroke
+_WARN_CMDS = frozenset({"lock", "kill", "bin", "off"})
+_SUCCESS_CMDS = frozenset({"g", "p", "clip"})
+_SYS_CMDS = frozenset({"lock", "kill", "bin", "off", "zzz", "clip"})
+_MEDIA_CMDS = frozenset({"next", "prev", "pause", "play"})
+_OP_RE = re.compile(r"[+\-*/]")
+
+# Calculator: characters allowed in an expression, and the AST nodes it may use
+_CALC_RE = re.compile(r"^[\d+\-*/().% ]+$")
+_CALC_BINOPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_CALC_UNARYOPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+_CALC_MAX_EXPONENT = 1000  # 9**9**9 would freeze the UI thread
+# Results past this many digits are refused before they are computed:
+# (9**999)**999 already takes a noticeable while, and str(int) refuses
+# more than ~4300 digits anyway
+_CALC_MAX_DIGITS = 4300
+_LOG10_2 = math.log10(2)
+
+# Clipboard previews: line breaks and tabs become spaces in one pass
+_NL_TR = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# Fast junk filters (String match only) - one regex scan per path
+JUNK_PATTERNS = [
+    "\\AppData\\Local\\Temp", ".sys", ".dll", ".cab",
+    "$Recycle", "AppCrash", "Uninstall", "setup.exe", "install.exe"
+]
+_JUNK_RE = re.compile("|".join(re.escape(p.lower()) for p in JUNK_PATTERNS))
+
+# File extension -> (icon, color key), flattened once for dict lookups
+# Results launched as programs (sorted first, rocket icon)
+_APP_EXTS = (".exe", ".lnk")
+
+_EXT_STYLE = {
+    ext: (icon, color_key)
+    for color_key, icon, extensions in (
+        ("icon_image", "🖼️", ["png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp"]),
+        ("icon_code", "📄", ["py", "js", "ts", "html", "css", "json", "jsx", "tsx", "vue", "cpp", "c", "h", "java", "go", "rs"]),
+        ("icon_doc", "📝", ["pdf", "doc", "docx", "txt", "md", "rtf", "odt", "xls", "xlsx"]),
+        ("icon_zip", "📦", ["zip", "rar", "7z", "tar", "gz", "bz2"]),
+    )
+    for ext in extensions
+}
+
+# Container shadow: fits inside the window's root margins
+SHADOW_MARGIN = 12
+SHADOW_OFFSET = 4
+SHADOW_RADIUS = 16  # Matches the container's border-radius
+
+# Painted by ResultDelegate (same values the old per-row QSS used)
+ROW_STYLE = {
+    "hover_bg": QColor(255, 255, 255, 13),
+    "hover_border": QColor(255, 255, 255, 20),
+    "selected_bg": QColor(94, 156, 255, 38),
+    "selected_border": QColor(94, 156, 255, 89),
+    "icon_bg": QColor(255, 255, 255, 15),
+    "hint_bg": QColor(94, 156, 255, 31),
+    "title": QColor("#e6e6eb"),
+    "path": QColor("#6b7280"),
+    "header": QColor("#6b7280"),
+    "accent": QColor("#5e9cff"),
+}
+
+# Top/bottom of the glowContainer gradient, opaque (see OpaqueResultsHost)
+CONTAINER_GRADIENT = (QColor(20, 24, 33), QColor(15, 17, 21))
+
+# Border color -> shadow RGBA
+SHADOW_COLORS = {
+    "#f9a03f": (249, 160, 63, 40),
+    "#7bd88f": (123, 216, 143, 40),
+    "#5e9cff": (94, 156, 255, 50),
+}
+DEFAULT_SHADOW = SHADOW_COLORS["#5e9cff"]
+
+# Every rule is scoped by object name, so the whole dict is joined into
+# APP_QSS and parsed once on the Launcher window.
+# Result rows are not widgets: ResultDelegate paints them with ROW_STYLE.
 STYLES = {
-    "result_item_base": """
-        QFrame#resultItem {
-            background-color: transparent;
-            border-radius: 8px;
-            border: 1px solid transparent;
+    "glow_container": """
+        QFrame#glowContainer {
+            background-color: qlineargradient(
+                x1:0, y1:0, x2:0, y2:1,
+                stop:0 rgba(20, 24, 33, 0.98),
+                stop:1 rgba(15, 17, 21, 0.98)
+            );
+            border: 1px solid #5e9cff;
+            border-radius: 16px;
         }
-    """,
-    "result_item_selected": """
-        QFrame#resultItem {
-            background-color: rgba(94, 156, 255, 0.15);
-            border-radius: 8px;
-            border: 1px solid rgba(94, 156, 255, 0.35);
+    """ + "".join(
+        # One rule per state color; GlowingContainer switches by property
+        f'QFrame#glowContainer[border="{color}"] {{ border: 1px solid {color}; }}\n'
+        for color in SHADOW_COLORS
+    ),
+    "search_bar": """
+        QLabel#searchIcon {
+            font-size: 20px;
+            color: #5e9cff;
+            font-weight: bold;
         }
-    """,
-    "result_item_hover": """
-        QFrame#resultItem {
+        QLabel#keyHint {
+            font-size: 9px;
+            color: #4b5563;
+            padding: 3px 6px;
             background-color: rgba(255, 255, 255, 0.05);
-            border-radius: 8px;
-            border: 1px solid rgba(255, 255, 255, 0.08);
-        }
-    """,
-    "icon_container": """
-        QFrame#iconBox {
-            background-color: rgba(255, 255, 255, 0.06);
-            border-radius: 6px;
-        }
-    """,
-    "shortcut_visible": """
-        QLabel#shortcutHint {
-            font-size: 10px;
-            color: #5e9cff;
-            padding: 2px 6px;
-            background-color: rgba(94, 156, 255, 0.12);
             border-radius: 4px;
             font-weight: 500;
         }
-    """,
-    "shortcut_hidden": """
-        QLabel#shortcutHint {
-            font-size: 10px;
-            color: transparent;
-            background-color: transparent;
-            padding: 2px 6px;
+        QFrame#divider {
+            background-color: #1f2937;
         }
     """,
     "search_input": """
@@ -92,13 +171,11 @@ STYLES = {
             selection-background-color: rgba(94, 156, 255, 0.3);
         }
     """,
-    "scroll_area": """
-        QScrollArea {
+    "results_view": """
+        QListView#resultsView {
             background-color: transparent;
             border: none;
-        }
-        QWidget#resultsContainer {
-            background-color: transparent;
+            outline: none;
         }
         QScrollBar:vertical {
             background-color: transparent;
@@ -125,25 +202,175 @@ STYLES = {
             background: transparent;
         }
     """,
-    "category_header": """
-        QLabel#categoryHeader {
+    "no_results": """
+        QLabel#noResultsIcon {
+            background: transparent;
+        }
+        QLabel#noResultsText {
             color: #6b7280;
-            font-size: 10px;
-            font-weight: 600;
-            letter-spacing: 1.2px;
+            font-size: 14px;
+        }
+        QLabel#noResultsHint {
+            color: #4b5563;
+            font-size: 11px;
             background: transparent;
         }
     """,
-    "no_results": """
-        color: #6b7280;
-        font-size: 14px;
-    """,
     "loading_spinner": """
-        font-size: 16px;
-        color: #5e9cff;
+        QLabel#loadingSpinner {
+            background: transparent;
+        }
     """
 }
 
+APP_QSS = "\n".join(STYLES.values())
+
+
+@functools.lru_cache(maxsize=2048)
+def _file_style(filename: str, is_folder: bool, path_lower: str) -> tuple:
+    """(icon, color key) for a file result; pure, so cached across queries."""
+    if is_folder:
+        return "📂", "icon_folder"
+    
+    if path_lower.endswith(_APP_EXTS):
+        return "🚀", "icon_app"
+    
+    ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    return _EXT_STYLE.get(ext, ("📄", "icon_default"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _smart_truncate(path: str, max_chars: int = 55) -> str:
+    """Intelligently truncate long paths."""
+    if not path or len(path) <= max_chars:
+        return path
+    
+    parts = path.replace("\\", "/").split("/")
+    if len(parts) < 4:
+        return path[:max_chars - 3] + "..."
+    
+    return f"{parts[0]}/…/{parts[-2]}/{parts[-1]}"
+
+
+@functools.lru_cache(maxsize=256)
+def _calc(expr: str):
+    """Evaluates an arithmetic expression (numbers and + - * / // % ** only)."""
+    def walk(node):
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return node.value
+        if isinstance(node, ast.BinOp) and type(node.op) in _CALC_BINOPS:
+            left, right = walk(node.left), walk(node.right)
+            if isinstance(node.op, ast.Pow):
+                if abs(right) > _CALC_MAX_EXPONENT:
+                    raise ValueError("exponent too large")
+                if abs(left) > 1 and abs(right) * math.log10(abs(left)) > _CALC_MAX_DIGITS:
+                    raise ValueError("result too large")
+            elif (
+                isinstance(node.op, ast.Mult)
+                and type(left) is int and type(right) is int
+                and (left.bit_length() + right.bit_length()) * _LOG10_2 > _CALC_MAX_DIGITS
+            ):
+                raise ValueError("result too large")
+            return _CALC_BINOPS[type(node.op)](left, right)
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _CALC_UNARYOPS:
+            return _CALC_UNARYOPS[type(node.op)](walk(node.operand))
+        raise ValueError("unsupported expression")
+    
+    return walk(ast.parse(expr, mode="eval").body)
+
+
+def _match_spans(labels: list, query: str) -> list:
+    """
+    (start, length) of the first case-insensitive match of `query` in each
+    label, or None. One pass over all rows, query lowered once.
+    """
+    if not query or len(query) < 2:
+        return [None] * len(labels)
+    q = query.lower()
+    n = len(q)
+    hits = [label.lower().find(q) for label in labels]
+    return [(idx, n) if idx != -1 else None for idx in hits]
+
+
+def _font(pixel_size: int, weight=QFont.Weight.Normal) -> QFont:
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    return font
+
+
+@functools.lru_cache(maxsize=None)
+def _icon_pixmap(glyph: str, font_px: int, box: int) -> QPixmap:
+    """
+    Emoji/symbol icon rasterized once into a `box`-sized pixmap. Painting
+    emoji as text goes through the color-emoji font shaper every time.
+    """
+    dpr = QGuiApplication.primaryScreen().devicePixelRatio()
+    size = round(box * dpr)
+    
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setFont(_font(round(font_px * dpr)))
+    painter.setPen(ROW_STYLE["title"])
+    painter.drawText(QRectF(0, 0, size, size), Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+    
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+@functools.lru_cache(maxsize=None)
+def _shadow_pixmap(rgba: tuple) -> QPixmap:
+    """
+    Soft rounded-rect shadow, rendered once per color and drawn as a 9-slice.
+    Stacked insets build a linear falloff, standing in for a live blur.
+    """
+    corner = SHADOW_MARGIN + SHADOW_RADIUS
+    size = 2 * corner + 1
+
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    r, g, b, a = rgba
+    layer = QColor(r, g, b, max(1, a // SHADOW_MARGIN))
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(layer)
+    for inset in range(SHADOW_MARGIN):
+        radius = corner - inset
+        painter.drawRoundedRect(
+            QRectF(inset, inset, size - 2 * inset, size - 2 * inset), radius, radius
+        )
+    painter.end()
+
+    return QPixmap.fromImage(image)
+
+
+def _native_window_shadow() -> bool:
+    """True where the window system already shadows our translucent window."""
+    return sys.platform == "darwin" or QGuiApplication.platformName().startswith("wayland")
+
+
+def _draw_nine_slice(painter: QPainter, target: QRectF, pixmap: QPixmap, corner: int):
+    """Draws `pixmap` into `target`, keeping its corners and stretching the rest."""
+    w, h = pixmap.width(), pixmap.height()
+    src_x = (0, corner, w - corner, w)
+    src_y = (0, corner, h - corner, h)
+    dst_x = (target.left(), target.left() + corner, target.right() - corner, target.right())
+    dst_y = (target.top(), target.top() + corner, target.bottom() - corner, target.bottom())
+
+    for row in range(3):
+        for col in range(3):
+            painter.drawPixmap(
+                QRectF(dst_x[col], dst_y[row], dst_x[col + 1] - dst_x[col], dst_y[row + 1] - dst_y[row]),
+                pixmap,
+                QRectF(src_x[col], src_y[row], src_x[col + 1] - src_x[col], src_y[row + 1] - src_y[row]),
+            )
+
 
 # ============================================================================
 #  THREAD-SAFE SIGNAL BRIDGE
@@ -154,196 +381,214 @@ class LauncherSignals(QObject):
     show_signal = pyqtSignal()
     show_clip_signal = pyqtSignal()
     hide_signal = pyqtSignal()
+    search_done = pyqtSignal(str, str, str, list)  # kind, query, search_query, results
 
 
 # ============================================================================
 #  CUSTOM WIDGETS - FIXED
 # ============================================================================
 
-class ResultItem(QFrame):
-    """A single result row with hover effects and selection state."""
-    clicked = pyqtSignal()
+class ResultsModel(QAbstractListModel):
+    """
+    Rows for the results list. Each row is a dict: either a result
+    (icon, label, subtext, full_path, clean_path, command) or a {"header": title}.
+    A result may instead carry its source "option"; icon and subtext are
+    then filled in by `resolve_display` the first time the row is painted.
+    """
+    IconRole = Qt.ItemDataRole.UserRole + 1
+    LabelRole = Qt.ItemDataRole.UserRole + 2
+    SubtextRole = Qt.ItemDataRole.UserRole + 3
+    MatchSpanRole = Qt.ItemDataRole.UserRole + 4
+    CommandRole = Qt.ItemDataRole.UserRole + 5
+    HeaderRole = Qt.ItemDataRole.UserRole + 6
     
-    def __init__(self, icon: str, icon_color: str, label: str, subtext: str, colors: dict, query: str = "", parent=None):
+    _ROLE_KEYS = {
+        Qt.ItemDataRole.DisplayRole: "label",
+        IconRole: "icon",
+        LabelRole: "label",
+        SubtextRole: "subtext",
+        CommandRole: "command",
+        HeaderRole: "header",
+    }
+    
+    def __init__(self, resolve_display=None, parent=None):
         super().__init__(parent)
-        self.colors = colors
-        self.setObjectName("resultItem")
-        self.command_ref = None
-        self.full_path = ""
-        self._selected = False
-        self._query = query
-        self._label_text = label
-        
-        # Fixed height for consistent spacing
-        self.setFixedHeight(ITEM_HEIGHT)
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        
-        # FIX: Don't use opacity effect - it causes repaint issues
-        # Instead, we'll handle opacity via stylesheets if needed
-        
-        # Apply base style immediately
-        self.setStyleSheet(STYLES["result_item_base"])
-        
-        # Main horizontal layout
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 0, 12, 0)
-        layout.setSpacing(12)
-        
-        # === Icon Container (Fixed Size) ===
-        icon_container = QFrame()
-        icon_container.setObjectName("iconBox")
-        icon_container.setFixedSize(32, 32)
-        icon_container.setStyleSheet(STYLES["icon_container"])
-        
-        icon_layout = QHBoxLayout(icon_container)
-        icon_layout.setContentsMargins(0, 0, 0, 0)
-        icon_layout.setSpacing(0)
-        
-        self.icon_label = QLabel(icon)
-        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_label.setStyleSheet("font-size: 16px; background: transparent;")
-        self.icon_label.setFixedSize(32, 32)
-        icon_layout.addWidget(self.icon_label)
-        layout.addWidget(icon_container)
-        
-        # === Text Container (Expanding) - FIXED ===
-        text_container = QWidget()
-        text_container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        text_container.setFixedHeight(ITEM_HEIGHT)
-        text_layout = QVBoxLayout(text_container)
-        text_layout.setSpacing(2)
-        text_layout.setContentsMargins(0, 8, 0, 8)
-        
-        # FIX: Title label - prevent text overlap
-        self.title_label = QLabel()
-        self.title_label.setTextFormat(Qt.TextFormat.RichText)
-        self.title_label.setText(self._highlight_match(label))
-        self.title_label.setStyleSheet("""
-            font-size: 13px;
-            font-weight: 600;
-            color: #e6e6eb;
-            background: transparent;
-        """)
-        self.title_label.setFixedHeight(18)
-        self.title_label.setMinimumWidth(100)
-        # FIX: Critical - prevent word wrap and set proper size policy
-        self.title_label.setWordWrap(False)
-        self.title_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        
-        # FIX: Path/subtext label - prevent overlap
-        self.path_label = QLabel(subtext)
-        self.path_label.setStyleSheet("""
-            font-size: 11px;
-            color: #6b7280;
-            background: transparent;
-        """)
-        self.path_label.setFixedHeight(14)
-        self.path_label.setWordWrap(False)  # FIX: Prevent wrapping
-        self.path_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        
-        # FIX: Use elide mode to handle overflow gracefully
-        self.title_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-        self.path_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-        
-        text_layout.addWidget(self.title_label)
-        text_layout.addWidget(self.path_label)
-        layout.addWidget(text_container, 1)
-        
-        # === Shortcut Hint (FIXED WIDTH) ===
-        self.shortcut_label = QLabel()
-        self.shortcut_label.setObjectName("shortcutHint")
-        self.shortcut_label.setFixedSize(SHORTCUT_WIDTH, 20)
-        self.shortcut_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.shortcut_label.setStyleSheet(STYLES["shortcut_hidden"])
-        layout.addWidget(self.shortcut_label)
-    
-    def _highlight_match(self, text: str) -> str:
-        """Highlight matching text with accent color."""
-        if not self._query or len(self._query) < 2:
-            return text
-        
-        try:
-            # FIX: Escape HTML entities to prevent rendering issues
-            import html
-            text_escaped = html.escape(text)
-            query_escaped = html.escape(self._query)
-            
-            idx = text_escaped.lower().find(query_escaped.lower())
-            if idx == -1:
-                return text_escaped
-            
-            matched = text_escaped[idx:idx + len(query_escaped)]
-            return (
-                f'{text_escaped[:idx]}'
-                f'<span style="color:#5e9cff;font-weight:700;">{matched}</span>'
-                f'{text_escaped[idx + len(query_escaped):]}'
-            )
-        except:
-            return text
-    
-    def set_shortcut_hint(self, text: str):
-        """Show/hide keyboard shortcut hint without layout shift."""
-        if text:
-            self.shortcut_label.setText(text)
-            self.shortcut_label.setStyleSheet(STYLES["shortcut_visible"])
-        else:
-            self.shortcut_label.setText("")
-            self.shortcut_label.setStyleSheet(STYLES["shortcut_hidden"])
+        self._resolve_display = resolve_display  # row -> (icon, subtext)
+        self._rows = []
+        self._item_rows = []  # Model row of each selectable result
+        self._spans = []  # Highlight span per row, computed in set_rows
     
-    def set_selected(self, selected: bool):
-        """FIX: Update selection with proper repaint."""
-        if self._selected != selected:
-            self._selected = selected
-            self._update_style()
-            # FIX: Force immediate repaint to prevent ghosting
-            self.update()
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
     
-    def _update_style(self):
-        if self._selected:
-            self.setStyleSheet(STYLES["result_item_selected"])
-        else:
-            self.setStyleSheet(STYLES["result_item_base"])
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == self.MatchSpanRole:
+            return self._spans[index.row()]
+        if role in (self.IconRole, self.SubtextRole) and "icon" not in row and "option" in row:
+            # Only rows the view actually paints pay for the lookup (it stats files)
+            row["icon"], row["subtext"] = self._resolve_display(row)
+        key = self._ROLE_KEYS.get(role)
+        return row.get(key) if key else None
     
-    def enterEvent(self, event):
-        if not self._selected:
-            self.setStyleSheet(STYLES["result_item_hover"])
-        super().enterEvent(event)
+    def flags(self, index):
+        if not index.isValid() or "header" in self._rows[index.row()]:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
     
-    def leaveEvent(self, event):
-        self._update_style()
-        super().leaveEvent(event)
+    def set_rows(self, rows: list, query: str = ""):
+        """Replaces every row in one reset - the view relayouts once."""
+        self.beginResetModel()
+        self._rows = rows
+        self._item_rows = [i for i, row in enumerate(rows) if "header" not in row]
+        self._spans = _match_spans([row.get("label", "") for row in rows], query)
+        self.endResetModel()
     
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
+    def clear(self):
+        if self._rows:
+            self.set_rows([])
     
-    def fade_in(self, delay: int = 0):
-        """FIX: Simple show without problematic opacity animation."""
-        # Removed QGraphicsOpacityEffect - it causes repaint artifacts
-        # If you need fade, use stylesheet opacity instead
-        self.show()
+    def items(self) -> list:
+        """Selectable result rows, in display order."""
+        return [self._rows[i] for i in self._item_rows]
+    
+    def item_index(self, item_pos: int) -> QModelIndex:
+        """Model index of the `item_pos`-th selectable result."""
+        return self.index(self._item_rows[item_pos], 0)
 
 
-class CategoryHeader(QWidget):
-    """Section header for grouping results - FIXED SPACING."""
+class ResultDelegate(QStyledItemDelegate):
+    """
+    Paints result rows and category headers directly - no per-row widgets.
+    Any future fade should animate colors here: QSS `opacity` or a
+    QGraphicsOpacityEffect would push the list into an offscreen layer.
+    """
     
-    def __init__(self, title: str, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFixedHeight(HEADER_HEIGHT)
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._title_font = _font(13, QFont.Weight.DemiBold)
+        self._match_font = _font(13, QFont.Weight.Bold)
+        self._path_font = _font(11)
+        self._hint_font = _font(10, QFont.Weight.Medium)
+        self._header_font = _font(10, QFont.Weight.DemiBold)
+        self._header_font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 1.2)
+        self._title_metrics = QFontMetrics(self._title_font)
+        self._path_metrics = QFontMetrics(self._path_font)
+        # (text, is_match) -> laid-out QStaticText; repaints skip text shaping
+        self._static_text = functools.lru_cache(maxsize=2048)(self._make_static_text)
+        # (text, width, is_path) -> elided string; the row width only changes
+        # with the window, so repaints hit this cache
+        self._elided = functools.lru_cache(maxsize=4096)(self._make_elided)
+    
+    def _make_elided(self, text: str, width: int, is_path: bool) -> str:
+        metrics = self._path_metrics if is_path else self._title_metrics
+        return metrics.elidedText(text, Qt.TextElideMode.ElideRight, width)
+    
+    def _make_static_text(self, text: str, is_match: bool) -> QStaticText:
+        static = QStaticText(text)
+        static.setTextFormat(Qt.TextFormat.PlainText)
+        static.prepare(QTransform(), self._match_font if is_match else self._title_font)
+        return static
+    
+    def sizeHint(self, option, index):
+        # Spacing is part of the row so the view needs no extra gaps
+        if index.data(ResultsModel.HeaderRole):
+            return QSize(-1, HEADER_HEIGHT + ITEM_SPACING)
+        return QSize(-1, ITEM_HEIGHT + ITEM_SPACING)
+    
+    def paint(self, painter, option, index):
+        # A repaint of one row still offers its neighbours; skip rows the
+        # dirty region doesn't touch
+        if painter.hasClipping() and not painter.clipBoundingRect().intersects(QRectF(option.rect)):
+            return
         
-        layout = QHBoxLayout(self)
-        # FIX: Symmetric margins - prevents uneven spacing
-        layout.setContentsMargins(14, 4, 14, 2)
-        layout.setSpacing(0)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(option.rect).adjusted(0, 0, 0, -ITEM_SPACING)
+        
+        header = index.data(ResultsModel.HeaderRole)
+        if header:
+            painter.setFont(self._header_font)
+            painter.setPen(ROW_STYLE["header"])
+            painter.drawText(
+                rect.adjusted(14, 4, -14, -2),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                header,
+            )
+            painter.restore()
+            return
+        
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        
+        # Row background
+        if selected or hovered:
+            painter.setPen(ROW_STYLE["selected_border" if selected else "hover_border"])
+            painter.setBrush(ROW_STYLE["selected_bg" if selected else "hover_bg"])
+            painter.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+        
+        # Icon box
+        icon_rect = QRectF(rect.left() + 12, rect.center().y() - 16, 32, 32)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(ROW_STYLE["icon_bg"])
+        painter.drawRoundedRect(icon_rect, 6, 6)
+        icon = index.data(ResultsModel.IconRole)
+        if icon:
+            painter.drawPixmap(icon_rect.topLeft(), _icon_pixmap(icon, 16, 32))
+        
+        # Shortcut hint (selected row only); its space is reserved either way
+        hint_rect = QRectF(rect.right() - 12 - SHORTCUT_WIDTH, rect.center().y() - 10, SHORTCUT_WIDTH, 20)
+        if selected:
+            painter.setBrush(ROW_STYLE["hint_bg"])
+            painter.drawRoundedRect(hint_rect, 4, 4)
+            painter.setFont(self._hint_font)
+            painter.setPen(ROW_STYLE["accent"])
+            painter.drawText(hint_rect, Qt.AlignmentFlag.AlignCenter, "↵ Open")
+        
+        # Title + path
+        text_left = icon_rect.right() + 12
+        text_width = max(0.0, hint_rect.left() - 12 - text_left)
+        title_rect = QRectF(text_left, rect.top() + 8, text_width, 18)
+        path_rect = QRectF(text_left, title_rect.bottom() + 2, text_width, 14)
+        
+        self._draw_title(
+            painter, title_rect,
+            index.data(ResultsModel.LabelRole) or "",
+            index.data(ResultsModel.MatchSpanRole),
+        )
+        
+        painter.setFont(self._path_font)
+        painter.setPen(ROW_STYLE["path"])
+        path = self._elided(index.data(ResultsModel.SubtextRole) or "", int(text_width), True)
+        painter.drawText(path_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, path)
         
-        self.label = QLabel(title)
-        self.label.setObjectName("categoryHeader")
-        self.label.setStyleSheet(STYLES["category_header"])
-        layout.addWidget(self.label)
-        layout.addStretch()
+        painter.restore()
+    
+    def _draw_title(self, painter, rect: QRectF, label: str, span):
+        """Title with the query match drawn bold in the accent color."""
+        text = self._elided(label, int(rect.width()), False)
+        
+        # Highlight only if the match survived eliding (the "…" is not part of it)
+        visible = len(text) - (1 if text != label else 0)
+        if not span or span[0] + span[1] > visible:
+            chunks = ((text, False),)
+        else:
+            start, end = span[0], span[0] + span[1]
+            chunks = ((text[:start], False), (text[start:end], True), (text[end:], False))
+        
+        x = rect.left()
+        for chunk, is_match in chunks:
+            if not chunk:
+                continue
+            # Pen color is applied at draw time; font is baked into the cached layout
+            static = self._static_text(chunk, is_match)
+            size = static.size()
+            painter.setFont(self._match_font if is_match else self._title_font)
+            painter.setPen(ROW_STYLE["accent" if is_match else "title"])
+            painter.drawStaticText(QPointF(x, rect.top() + (rect.height() - size.height()) / 2), static)
+            x += size.width()
 
 
 class GlowingContainer(QFrame):
@@ -353,35 +598,42 @@ class GlowingContainer(QFrame):
         super().__init__(parent)
         self.setObjectName("glowContainer")
         self._border_color = "#5e9cff"
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(25)
-        self.shadow.setOffset(0, 4)
-        self.setGraphicsEffect(self.shadow)
+        # No QGraphicsDropShadowEffect: it re-renders and re-blurs the whole
+        # container offscreen on every repaint. The parent window draws a
+        # pre-rendered shadow instead (see paint_shadow).
+        self._shadow_rgba = DEFAULT_SHADOW
+        self._paints_shadow = not _native_window_shadow()
         self._update_style()
     
     def set_border_color(self, color: str):
+        if color == self._border_color:
+            return
         self._border_color = color
         self._update_style()
         
-        color_map = {
-            "#f9a03f": QColor(249, 160, 63, 40),
-            "#7bd88f": QColor(123, 216, 143, 40),
-            "#5e9cff": QColor(94, 156, 255, 50),
-        }
-        self.shadow.setColor(color_map.get(color, QColor(94, 156, 255, 50)))
+        self._shadow_rgba = SHADOW_COLORS.get(color, DEFAULT_SHADOW)
+        if self._paints_shadow and self.parentWidget() is not None:
+            self.parentWidget().update()
+    
+    def paint_shadow(self, painter: QPainter):
+        """Paints the shadow around this container, in parent coordinates."""
+        if not self._paints_shadow:
+            return
+        target = QRectF(self.geometry()).translated(0, SHADOW_OFFSET).adjusted(
+            -SHADOW_MARGIN, -SHADOW_MARGIN, SHADOW_MARGIN, SHADOW_MARGIN
+        )
+        _draw_nine_slice(
+            painter, target, _shadow_pixmap(self._shadow_rgba), SHADOW_MARGIN + SHADOW_RADIUS
+        )
     
     def _update_style(self):
-        self.setStyleSheet(f"""
-            QFrame#glowContainer {{
-                background-color: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(20, 24, 33, 0.98),
-                    stop:1 rgba(15, 17, 21, 0.98)
-                );
-                border: 1px solid {self._border_color};
-                border-radius: 16px;
-            }}
-        """)
+        # Rules live in APP_QSS; a property flip re-matches them without
+        # handing Qt a new stylesheet to parse
+        self.setProperty("border", self._border_color)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+        self.update()
 
 
 class SearchInput(QLineEdit):
@@ -391,7 +643,34 @@ class SearchInput(QLineEdit):
         super().__init__(parent)
         self.setObjectName("searchInput")
         self.setPlaceholderText("Search apps, files, or type a command...")
-        self.setStyleSheet(STYLES["search_input"])
+
+
+SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+SPINNER_SIZE = 24
+
+
+@functools.lru_cache(maxsize=None)
+def _spinner_frames() -> tuple:
+    """Rasterizes the spinner glyphs once into a sprite strip, split per frame."""
+    dpr = QGuiApplication.primaryScreen().devicePixelRatio()
+    px = round(SPINNER_SIZE * dpr)
+    
+    sheet = QPixmap(px * len(SPINNER_FRAMES), px)
+    sheet.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(sheet)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setFont(_font(round(16 * dpr)))
+    painter.setPen(ROW_STYLE["accent"])
+    for i, glyph in enumerate(SPINNER_FRAMES):
+        painter.drawText(QRectF(i * px, 0, px, px), Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+    
+    frames = []
+    for i in range(len(SPINNER_FRAMES)):
+        frame = sheet.copy(i * px, 0, px, px)
+        frame.setDevicePixelRatio(dpr)
+        frames.append(frame)
+    return tuple(frames)
 
 
 class LoadingSpinner(QLabel):
@@ -399,30 +678,64 @@ class LoadingSpinner(QLabel):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(STYLES["loading_spinner"])
-        self.setFixedWidth(24)
+        self.setObjectName("loadingSpinner")
+        self.setFixedSize(SPINNER_SIZE, SPINNER_SIZE)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        self._frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        self._current_frame = 0
-        
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._next_frame)
+        # Qt drives the frame index; each step is a pixmap swap of a fixed
+        # size, so the label never re-measures text
+        self._anim = QVariantAnimation(self)
+        self._anim.setStartValue(0)
+        self._anim.setEndValue(len(SPINNER_FRAMES))
+        self._anim.setDuration(80 * len(SPINNER_FRAMES))
+        self._anim.setLoopCount(-1)
+        self._anim.valueChanged.connect(self._show_frame)
         self.hide()
     
-    def _next_frame(self):
-        self._current_frame = (self._current_frame + 1) % len(self._frames)
-        self.setText(self._frames[self._current_frame])
+    def _show_frame(self, value):
+        frames = _spinner_frames()
+        self.setPixmap(frames[int(value) % len(frames)])
     
     def start(self):
         self.show()
-        self._timer.start(80)
+        if self._anim.state() != QVariantAnimation.State.Running:
+            self._show_frame(0)
+            self._anim.start()
     
     def stop(self):
-        self._timer.stop()
+        self._anim.stop()
         self.hide()
 
 
+class OpaqueResultsHost(QWidget):
+    """
+    Opaque backdrop for the results list. The window is translucent, so
+    without it every list repaint also repaints the window shadow and the
+    container beneath; an opaque widget stops that at its own bounds.
+    """
+    
+    def __init__(self, child: QWidget, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(child)
+    
+    def paintEvent(self, event):
+        # Continue the container's gradient so the host doesn't show as a box
+        container = self.parentWidget()
+        top = self.mapTo(container, QPoint(0, 0)).y()
+        gradient = QLinearGradient(0, -top, 0, container.height() - top)
+        gradient.setColorAt(0, CONTAINER_GRADIENT[0])
+        gradient.setColorAt(1, CONTAINER_GRADIENT[1])
+        
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), gradient)
+        painter.end()
+
+
 class NoResultsWidget(QWidget):
     """Empty state when no results found."""
     
@@ -434,16 +747,17 @@ class NoResultsWidget(QWidget):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.setSpacing(8)
         
-        icon = QLabel("🔍")
-        icon.setStyleSheet("font-size: 28px; background: transparent;")
+        icon = QLabel()
+        icon.setObjectName("noResultsIcon")
+        icon.setPixmap(_icon_pixmap("🔍", 28, 40))
         icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         text = QLabel("No results found")
-        text.setStyleSheet(STYLES["no_results"])
+        text.setObjectName("noResultsText")
         text.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         hint = QLabel("Try a different search term")
-        hint.setStyleSheet("color: #4b5563; font-size: 11px; background: transparent;")
+        hint.setObjectName("noResultsHint")
         hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         layout.addWidget(icon)
@@ -465,6 +779,7 @@ class Launcher(QWidget):
         self.signals.show_signal.connect(self._do_show)
         self.signals.show_clip_signal.connect(self._do_show_clip)
         self.signals.hide_signal.connect(self._do_hide)
+        self.signals.search_done.connect(self._on_search_done)
         
         # Core managers
         self.everything = EverythingManager()
@@ -478,9 +793,25 @@ class Launcher(QWidget):
         # State
         self.last_command = ""
         self.current_query = ""
-        self.search_timer = QTimer(self)
-        self.search_timer.setSingleShot(True)
-        self.search_timer.timeout.connect(self.perform_live_search)
+        # Trailing throttle: search 60ms after the first keystroke, then at
+        # most once per 80ms while typing continues (see on_text_changed)
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(60)
+        self._debounce_timer.timeout.connect(self._on_debounce)
+        self._throttle_gate = QTimer(self)
+        self._throttle_gate.setSingleShot(True)
+        self._throttle_gate.setInterval(80)
+        self._throttle_gate.timeout.connect(self._on_throttle_gate)
+        self._scheduled_query = ""
+        self._pending_query = None
+        
+        # (family, everything query) -> results after prioritize/mapping,
+        # so retyping a stem ("dis" -> "disc" -> "dis") skips the search
+        self._search_cache = OrderedDict()
+        # Clipboard menu options for ClipboardManager.version (see _clip_options)
+        self._clip_cache = []
+        self._clip_cache_ver = None
         
         self.result_items = []
         self.selected_index = -1
@@ -495,6 +826,13 @@ class Launcher(QWidget):
         self.recent_searches = self.settings.value("recent_searches", [])
         if not isinstance(self.recent_searches, list):
             self.recent_searches = []
+        # The list in memory is authoritative; QSettings is written when idle
+        self._recent_dirty = False
+        self._recent_flush_timer = QTimer(self)
+        self._recent_flush_timer.setSingleShot(True)
+        self._recent_flush_timer.setInterval(2000)
+        self._recent_flush_timer.timeout.connect(self._flush_recent)
+        QApplication.instance().aboutToQuit.connect(self._flush_recent)
         
         # Theme colors
         self.colors = {
@@ -544,6 +882,9 @@ class Launcher(QWidget):
         
     def setup_ui(self):
         """Build all UI components."""
+        # One stylesheet for the whole tree - children match by object name
+        self.setStyleSheet(APP_QSS)
+        
         root_layout = QVBoxLayout(self)
         root_layout.setContentsMargins(12, 12, 12, 16)
         root_layout.setSpacing(0)
@@ -560,11 +901,7 @@ class Launcher(QWidget):
         search_layout.setSpacing(14)
         
         self.search_icon = QLabel("⌘")
-        self.search_icon.setStyleSheet("""
-            font-size: 20px;
-            color: #5e9cff;
-            font-weight: bold;
-        """)
+        self.search_icon.setObjectName("searchIcon")
         self.search_icon.setFixedWidth(24)
         search_layout.addWidget(self.search_icon)
         
@@ -583,14 +920,7 @@ class Launcher(QWidget):
         
         for hint in ["↑↓", "⏎", "ESC"]:
             hint_label = QLabel(hint)
-            hint_label.setStyleSheet("""
-                font-size: 9px;
-                color: #4b5563;
-                padding: 3px 6px;
-                background-color: rgba(255, 255, 255, 0.05);
-                border-radius: 4px;
-                font-weight: 500;
-            """)
+            hint_label.setObjectName("keyHint")
             hints_layout.addWidget(hint_label)
         
         search_layout.addWidget(hints_widget)
@@ -599,34 +929,38 @@ class Launcher(QWidget):
         # Divider
         self.divider = QFrame()
         self.divider.setFixedHeight(1)
-        self.divider.setStyleSheet(f"background-color: {self.colors['divider']};")
+        self.divider.setObjectName("divider")
         self.divider.hide()
         container_layout.addWidget(self.divider)
         
-        # Results area - FIX: Proper setup to prevent z-index issues
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet(STYLES["scroll_area"])
-        self.scroll_area.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.scroll_area.hide()
-        
-        # FIX: Create results widget with explicit opaque background
-        self.results_widget = QWidget()
-        self.results_widget.setObjectName("resultsContainer")
-        self.results_widget.setAutoFillBackground(True)  # FIX: Ensure background is painted
-        
-        self.results_layout = QVBoxLayout(self.results_widget)
-        self.results_layout.setContentsMargins(CONTENT_PADDING, CONTENT_PADDING, CONTENT_PADDING, CONTENT_PADDING)
-        self.results_layout.setSpacing(ITEM_SPACING)
-        self.results_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        # FIX: Add stretch at bottom to prevent items from expanding
-        self.results_layout.addStretch()
-        
-        self.scroll_area.setWidget(self.results_widget)
-        container_layout.addWidget(self.scroll_area)
+        # Results area: one view over a model, rows painted by ResultDelegate
+        self.results_model = ResultsModel(self._resolve_row_display, self)
+        self.results_view = QListView()
+        self.results_view.setObjectName("resultsView")
+        self.results_view.setModel(self.results_model)
+        self.results_view.setItemDelegate(ResultDelegate(self.results_view))
+        self.results_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.results_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.results_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.results_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.results_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.results_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)  # Typing stays in the entry
+        self.results_view.setMouseTracking(True)
+        self.results_view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+        self.results_view.clicked.connect(self._on_result_clicked)
+        
+        # Inset by CONTENT_PADDING, the opaque host stays clear of the
+        # container's rounded corners
+        self.results_host = OpaqueResultsHost(self.results_view)
+        self.results_host.hide()
+        results_layout = QVBoxLayout()
+        results_layout.setContentsMargins(CONTENT_PADDING, CONTENT_PADDING, CONTENT_PADDING, CONTENT_PADDING)
+        results_layout.addWidget(self.results_host)
+        container_layout.addLayout(results_layout)
+        
+        self.no_results = NoResultsWidget()
+        self.no_results.hide()
+        container_layout.addWidget(self.no_results)
         
         root_layout.addWidget(self.container)
         self.installEventFilter(self)
@@ -638,6 +972,12 @@ class Launcher(QWidget):
         QShortcut(QKeySequence("Alt+C"), self, self.on_copy_path)
         QShortcut(QKeySequence("Tab"), self, self.on_tab_complete)
     
+    def paintEvent(self, event):
+        """Window is translucent - only the container's shadow is painted here."""
+        painter = QPainter(self)
+        self.container.paint_shadow(painter)
+        painter.end()
+    
     def eventFilter(self, obj, event):
         """Handle window focus loss."""
         if event.type() == QEvent.Type.WindowDeactivate:
@@ -680,6 +1020,7 @@ class Launcher(QWidget):
     def _do_show(self):
         """Internal show - always runs on main thread."""
         self.can_hide = False
+        self._search_cache.clear()  # New session: files may have changed since
         self.entry.clear()
         self.reset_ui()
         
@@ -708,6 +1049,7 @@ class Launcher(QWidget):
         """Internal hide."""
         self.loading_spinner.stop()
         self.hide()
+        self._flush_recent()
     
     def reset_ui(self):
         """Reset to initial empty state."""
@@ -716,7 +1058,8 @@ class Launcher(QWidget):
         self.current_query = ""
         self._clear_results()
         
-        self.scroll_area.hide()
+        self.results_host.hide()
+        self.no_results.hide()
         self.divider.hide()
         
         self.setFixedHeight(self.base_height + 24)
@@ -726,22 +1069,59 @@ class Launcher(QWidget):
         self.loading_spinner.stop()
     
     def _clear_results(self):
-        """FIX: Clear all result items with immediate visual update."""
-        # Clear items list first
-        self.result_items.clear()
-        
-        # Remove all widgets from layout (except the stretch)
-        while self.results_layout.count() > 1:  # Keep the stretch
-            item = self.results_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.hide()  # FIX: Hide immediately before deletion
-                widget.setParent(None)
-                widget.deleteLater()
-        
-        # FIX: Force immediate layout update
-        self.results_widget.updateGeometry()
-        QApplication.processEvents()  # Process pending deletions
+        """Drop all rows - no widgets to hide or delete."""
+        self.result_items = []
+        self.results_model.clear()
+    
+    def _apply_frame_height(self, frame_height: int):
+        """Size the results host and window for a frame, skipping no-op resizes."""
+        # frame_height includes the padding around the list
+        host_height = frame_height - 2 * CONTENT_PADDING
+        if self.results_host.height() != host_height:
+            self.results_host.setFixedHeight(host_height)
+        window_height = self.base_height + frame_height + 28
+        if self.height() != window_height:
+            self.setFixedHeight(window_height)
+    
+    def _render_sections(self, sections: list):
+        """
+        Single renderer for every results list.
+        `sections` is [(header or None, model rows)], shown in order.
+        """
+        # No _clear_results(): _set_rows swaps the rows in a single reset
+        self.menu_active = True
+        
+        rows = []
+        item_count = header_count = 0
+        for header, section_rows in sections:
+            if header:
+                rows.append({"header": header})
+                header_count += 1
+            rows.extend(section_rows)
+            item_count += len(section_rows)
+        
+        needed_height = self._calculate_results_height(item_count, header_count)
+        self._set_rows(rows, min(needed_height, self.max_list_height))
+    
+    def _set_rows(self, rows: list, frame_height: int):
+        """Show `rows` in a results frame of `frame_height` and select the first result."""
+        # Resize, model reset, show/hide and selection land as one repaint
+        self.container.setUpdatesEnabled(False)
+        try:
+            self._apply_frame_height(frame_height)
+            
+            self.results_model.set_rows(rows, self.current_query)
+            self.result_items = self.results_model.items()
+            
+            self.no_results.hide()
+            self.divider.show()
+            self.results_host.show()
+            
+            if self.result_items:
+                self.selected_index = 0
+                self._update_selection()
+        finally:
+            self.container.setUpdatesEnabled(True)
 
     # ========================================================================
     #  RECENT SEARCHES
@@ -756,45 +1136,36 @@ class Launcher(QWidget):
         if query in self.recent_searches:
             self.recent_searches.remove(query)
         self.recent_searches.insert(0, query)
-        self.recent_searches = self.recent_searches[:5]
+        del self.recent_searches[5:]
+        self._recent_dirty = True
+        self._recent_flush_timer.start()
+    
+    def _flush_recent(self):
+        """Persist recent searches if they changed since the last write."""
+        self._recent_flush_timer.stop()
+        if not self._recent_dirty:
+            return
+        self._recent_dirty = False
         self.settings.setValue("recent_searches", self.recent_searches)
+        self.settings.sync()
     
     def show_recent_searches(self):
         """Display recent searches when input is empty."""
         if not self.recent_searches:
             return
         
-        self._clear_results()
-        self.menu_active = True
-        
-        # FIX: More accurate height calculation
-        needed_height = (
-            len(self.recent_searches) * (ITEM_HEIGHT + ITEM_SPACING) +
-            HEADER_HEIGHT +
-            CONTENT_PADDING * 2
-        )
-        frame_height = min(needed_height, self.max_list_height)
-        
-        self.divider.show()
-        self.scroll_area.show()
-        self.scroll_area.setFixedHeight(frame_height)
-        self.setFixedHeight(self.base_height + frame_height + 28)
-        
-        # FIX: Insert before the stretch (at position 0, not append)
-        header = CategoryHeader("🕐  Recent Searches")
-        self.results_layout.insertWidget(0, header)
-        
-        for i, term in enumerate(self.recent_searches):
-            item = ResultItem("🔍", self.colors["muted"], term, "Recent search", self.colors)
-            item.command_ref = lambda t=term: self._use_recent(t)
-            item.clicked.connect(item.command_ref)
-            
-            # FIX: Insert at correct position (after header)
-            self.results_layout.insertWidget(i + 1, item)
-            self.result_items.append(item)
-        
-        self.selected_index = 0
-        self._update_selection()
+        rows = [
+            {
+                "icon": "🔍",
+                "label": term,
+                "subtext": "Recent search",
+                "full_path": "",
+                "clean_path": "",
+                "command": functools.partial(self._use_recent, term),
+            }
+            for term in self.recent_searches
+        ]
+        self._render_sections([("🕐  Recent Searches", rows)])
     
     def _use_recent(self, term: str):
         """Use a recent search term."""
@@ -806,22 +1177,24 @@ class Launcher(QWidget):
     # ========================================================================
     
     def on_text_changed(self, text):
-        """Handle input text changes with debouncing."""
+        """Handle input text changes with a trailing throttle."""
         text = text.strip()
         self.current_query = text
         
         
         if not text:
+            self._debounce_timer.stop()
+            self._pending_query = None
             self.reset_ui()
             self.show_recent_searches()
             return
         
-        cmd = text.split(" ")[0].lower()
+        cmd = text.partition(" ")[0].lower()
         
         
-        if cmd in ["lock", "kill", "bin", "off"]:
+        if cmd in _WARN_CMDS:
             self.container.set_border_color(self.colors["warning"])
-        elif cmd in self.mapping or cmd in [ "g", "p", "clip"] or any(c in text for c in "+-*/"):
+        elif cmd in self.mapping or cmd in _SUCCESS_CMDS or _OP_RE.search(text):
             self.container.set_border_color(self.colors["success"])
         else:
             self.container.set_border_color(self.colors["accent"])
@@ -829,8 +1202,29 @@ class Launcher(QWidget):
         self.search_icon.hide()
         self.loading_spinner.start()
         
-        self.search_timer.stop()
-        self.search_timer.start(200)
+        if self._throttle_gate.isActive():
+            # A search just ran: the gate picks up the latest text when it closes
+            self._pending_query = text
+        else:
+            # Not restarted once running, so steady typing still gets results;
+            # the tick searches whatever the latest text is by then
+            self._scheduled_query = text
+            if not self._debounce_timer.isActive():
+                self._debounce_timer.start()
+    
+    def _on_debounce(self):
+        # A mismatch means the text was changed without a textChanged update
+        if self.entry.text().strip() == self._scheduled_query:
+            self._run_throttled_search()
+    
+    def _on_throttle_gate(self):
+        query, self._pending_query = self._pending_query, None
+        if query is not None and query == self.entry.text().strip():
+            self._run_throttled_search()
+    
+    def _run_throttled_search(self):
+        self.perform_live_search()
+        self._throttle_gate.start()
     
     def perform_live_search(self):
         """Execute the actual search."""
@@ -841,9 +1235,8 @@ class Launcher(QWidget):
         if not query:
             return
         
-        parts = query.split(" ")
-        cmd = parts[0].lower()
-        arg = " ".join(parts[1:]) if len(parts) > 1 else ""
+        cmd, _, arg = query.partition(" ")
+        cmd = cmd.lower()
         
         # OCR Command
         if cmd == "ocr":
@@ -927,7 +1320,7 @@ class Launcher(QWidget):
             return
 
         # Media Controls
-        if cmd in ["next", "prev", "pause", "play"]:
+        if cmd in _MEDIA_CMDS:
             self.show_selection_menu([{
                 "label": f"Media: {cmd.capitalize()}", 
                 "value": cmd, 
@@ -936,88 +1329,132 @@ class Launcher(QWidget):
             return
         
         # System Commands
-        if cmd in ["lock", "kill", "bin", "off", "zzz", "clip"]:
+        if cmd in _SYS_CMDS:
             self.reset_ui()
             return
         
         # Project Search
         if cmd == "p" and arg:
-            results = self.everything.search(f"folder:*{arg}*")
-            if results:
-                opts = [
-                    {
-                        "label": r["label"],
-                        "value": f'code "{r["value"]}"',
-                        "action_type": "cmd",
-                    }
-                    for r in results
-                ]
-                self.show_selection_menu(opts, category="💻  Projects")
-            else:
-                self.show_no_results()
+            self._search_async("projects", query, f"folder:*{arg}*")
             return
         
         # Standard File Search
-        results = self.everything.search(query)
-        if results:
-            # 1. Use the new FAST logic
-            optimized_results = self.prioritize_results(results)
-            
+        self._search_async("files", query, query)
+    
+    def _search_async(self, kind: str, query: str, search_query: str):
+        """Run an Everything search off the UI thread; results arrive via search_done."""
+        key = self._cache_key(kind, search_query)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            self.everything.cancel_pending()
+            self._show_search_results(kind, cached)
+            return
+        
+        self.search_icon.hide()
+        self.loading_spinner.start()
+        
+        future = self.everything.search_async(search_query)
+        
+        def done(f):
+            # Runs on the worker thread: rank here (it may stat a few paths),
+            # then hand the results over
+            if not f.cancelled() and f.exception() is None:
+                results = f.result()
+                if kind != "projects" and results:
+                    results = self.prioritize_results(results)
+                self.signals.search_done.emit(kind, query, search_query, results)
+        future.add_done_callback(done)
+    
+    @staticmethod
+    def _cache_key(kind: str, search_query: str) -> tuple:
+        # Live and Enter searches for the same text share one entry
+        return ("projects" if kind == "projects" else "files", search_query)
+    
+    def _on_search_done(self, kind: str, query: str, search_query: str, results: list):
+        """Prepare, cache and render search results on the UI thread."""
+        # Ignore results for text the user has already changed
+        if query != self.entry.text().strip():
+            return
+        
+        if kind == "projects":
+            results = [
+                {
+                    "label": r["label"],
+                    "value": f'code "{r["value"]}"',
+                    "action_type": "cmd",
+                }
+                for r in results
+            ]
+        # (file results were already ranked on the worker, see _search_async)
+        
+        self._search_cache[self._cache_key(kind, search_query)] = results
+        while len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        
+        self._show_search_results(kind, results)
+    
+    def _show_search_results(self, kind: str, results: list):
+        """Render prepared (prioritized / mapped) results."""
+        self.loading_spinner.stop()
+        self.search_icon.show()
+        
+        if kind == "projects":
+            if results:
+                self.show_selection_menu(results, category="💻  Projects")
+            else:
+                self.show_no_results()
+        elif results:
             # 2. Pass directly to show_selection_menu
-            self.show_selection_menu(optimized_results)
+            self.show_selection_menu(results)
+        elif kind == "submit":
+            self.show_no_results()
         else:
             self.reset_ui()
     
     def prioritize_results(self, results):
         """
         FAST LOGIC (Ported from Tkinter):
-        1. No os.path.isdir() calls (prevents lag).
+        1. os.path.isdir() only for the few survivors the backend didn't type
+           (es.exe output); runs on the search worker thread, not the UI.
         2. Strict .exe/.lnk priority.
         3. Hard limit of 15 items.
         """
-        apps = []
-        others = []
+        # Process ONLY the first 100 items to guarantee 0 lag.
+        # Work on parallel lists; only the <=15 survivors are touched.
+        head = results[:100]
+        lowers = [res.get("value", "").lower() for res in head]
         
-        # Fast junk filters (String match only)
-        junk_patterns = [
-            "\\AppData\\Local\\Temp", ".sys", ".dll", ".cab", 
-            "$Recycle", "AppCrash", "Uninstall", "setup.exe", "install.exe"
-        ]
+        # 1. Soft Filter: Skip empty paths and garbage
+        keep = [i for i, path_lower in enumerate(lowers) if path_lower and not _JUNK_RE.search(path_lower)]
         
-        # Process ONLY the first 100 items to guarantee 0 lag
-        for res in results[:100]:
-            path_val = res.get("value", "")
-            if not path_val:
-                continue
-                
-            path_lower = path_val.lower()
-            
-            # 1. Soft Filter: Skip garbage
-            if any(junk.lower() in path_lower for junk in junk_patterns):
-                continue
-            
-            # 2. Sorting: Apps vs Files (String check only - INSTANT)
-            if path_lower.endswith(".exe") or path_lower.endswith(".lnk"):
-                # Clean label (remove .exe extension from name)
-                if "." in res["label"]:
-                    res["label"] = res["label"].rsplit(".", 1)[0]
-                
-                res["category"] = "app"
-                res["action_type"] = "file"
-                apps.append(res)
-            else:
-                # Assume it's a generic file/folder for now to save speed
-                # We let the UI renderer decide the icon later
-                res["category"] = "file" 
-                res["action_type"] = "file"
-                others.append(res)
+        # 2. Sorting: Apps vs Files (String check only - INSTANT)
+        app_idx = [i for i in keep if lowers[i].endswith(_APP_EXTS)]
+        app_set = set(app_idx)
+        other_idx = [i for i in keep if i not in app_set]
         
-        # 3. Sort Apps by length (Shortest = Most likely match)
+        # 3. Sort Apps by length of the cleaned label (Shortest = Most likely match)
         # e.g. "Discord" (7 chars) beats "Discord Crash Handler" (21 chars)
-        apps.sort(key=lambda x: len(x["label"]))
+        clean = {i: head[i]["label"].rsplit(".", 1)[0] for i in app_idx}
+        app_idx.sort(key=lambda i: len(clean[i]))
         
         # 4. Merge and Chop (Apps first, then others, max 15 total)
-        final_list = (apps + others)[:15]
+        final_list = []
+        for i in (app_idx + other_idx)[:15]:
+            res = head[i]
+            if i in app_set:
+                # Clean label (remove .exe extension from name)
+                res["label"] = clean[i]
+                res["category"] = "app"
+                res["is_folder"] = False
+            else:
+                # Generic file/folder - the UI renderer decides the icon later
+                res["category"] = "file"
+                # The SDK reports folders; es.exe doesn't, so stat the survivor
+                if "is_folder" not in res:
+                    res["is_folder"] = os.path.isdir(res["value"])
+            res["action_type"] = "file"
+            final_list.append(res)
         
         return final_list
     
@@ -1030,93 +1467,32 @@ class Launcher(QWidget):
         padding = CONTENT_PADDING * 2
         return items_height + headers_height + header_spacing + padding
     
-    def show_categorized_results(self, categorized: dict):
-        """Display results grouped by category."""
-        self._clear_results()
-        self.menu_active = True
-        
-        total_items = sum(len(v) for v in categorized.values())
-        if total_items == 0:
-            self.show_no_results()
-            return
-        
-        num_headers = sum(1 for v in categorized.values() if v)
-        needed_height = self._calculate_results_height(total_items, num_headers)
-        frame_height = min(needed_height, self.max_list_height)
-        
-        self.divider.show()
-        self.scroll_area.show()
-        self.scroll_area.setFixedHeight(frame_height)
-        self.setFixedHeight(self.base_height + frame_height + 28)
-        
-        insert_index = 0
-        
-        # Apps section
-        if categorized.get("apps"):
-            header = CategoryHeader("🚀  Applications")
-            self.results_layout.insertWidget(insert_index, header)
-            insert_index += 1
-            
-            for option in categorized["apps"]:
-                item = self._create_result_item(option, len(self.result_items))
-                self.results_layout.insertWidget(insert_index, item)
-                insert_index += 1
-                self.result_items.append(item)
-        
-        # Folders section
-        if categorized.get("folders"):
-            header = CategoryHeader("📁  Folders")
-            self.results_layout.insertWidget(insert_index, header)
-            insert_index += 1
-            
-            for option in categorized["folders"]:
-                item = self._create_result_item(option, len(self.result_items))
-                self.results_layout.insertWidget(insert_index, item)
-                insert_index += 1
-                self.result_items.append(item)
-        
-        # Files section
-        if categorized.get("files"):
-            header = CategoryHeader("📄  Files")
-            self.results_layout.insertWidget(insert_index, header)
-            insert_index += 1
-            
-            for option in categorized["files"]:
-                item = self._create_result_item(option, len(self.result_items))
-                self.results_layout.insertWidget(insert_index, item)
-                insert_index += 1
-                self.result_items.append(item)
-        
-        if self.result_items:
-            self.selected_index = 0
-            self._update_selection()
+    def _make_row(self, option: dict, search_arg: str = "") -> dict:
+        """Build one results-model row for an option (display resolved lazily)."""
+        full_path = str(option.get("value", option.get("url", "")))
+        return {
+            "option": option,
+            "label": option.get("label", "Unknown"),
+            "full_path": full_path,
+            # Path without the 'code "..."' wrapper, for the copy / reveal shortcuts
+            "clean_path": full_path.replace('code "', "").replace('"', ""),
+            "command": functools.partial(self._invoke_option, option, search_arg),
+        }
     
-    def _create_result_item(self, option: dict, index: int) -> ResultItem:
-        """Create a single result item."""
-        label = option.get("label", "Unknown")
-        raw_val = str(option.get("value", option.get("url", "")))
-        
-        icon, icon_col, subtext = self._get_item_display(option, label, raw_val)
-        
-        item = ResultItem(icon, icon_col, label, subtext, self.colors, self.current_query)
-        item.full_path = raw_val
-        item.command_ref = self._make_command(option)
-        item.clicked.connect(item.command_ref)
-        
-        return item
+    def _resolve_row_display(self, row: dict):
+        """(icon, subtext) for a row built by _make_row."""
+        icon, icon_col, subtext = self._get_item_display(row["option"], row["label"], row["full_path"])
+        return icon, subtext
     
     def show_no_results(self):
         """Display empty state when no results found."""
         self._clear_results()
         self.menu_active = False
         
+        self.results_host.hide()
         self.divider.show()
-        self.scroll_area.show()
-        self.scroll_area.setFixedHeight(100)
+        self.no_results.show()
         self.setFixedHeight(self.base_height + 100 + 28)
-        
-        no_results = NoResultsWidget()
-        self.results_layout.insertWidget(0, no_results)
 
     # ========================================================================
     #  RESULTS DISPLAY
@@ -1124,42 +1500,8 @@ class Launcher(QWidget):
     
     def show_selection_menu(self, options, search_arg="", category=""):
         """Display search results list."""
-        self._clear_results()
-        self.menu_active = True
-        
-        header_count = 1 if category else 0
-        needed_height = self._calculate_results_height(len(options), header_count)
-        frame_height = min(needed_height, self.max_list_height)
-        
-        self.divider.show()
-        self.scroll_area.show()
-        self.scroll_area.setFixedHeight(frame_height)
-        self.setFixedHeight(self.base_height + frame_height + 28)
-        
-        insert_index = 0
-        
-        if category:
-            header = CategoryHeader(category)
-            self.results_layout.insertWidget(insert_index, header)
-            insert_index += 1
-        
-        for i, option in enumerate(options):
-            label = option.get("label", "Unknown")
-            raw_val = str(option.get("value", option.get("url", "")))
-            
-            icon, icon_col, subtext = self._get_item_display(option, label, raw_val)
-            
-            item = ResultItem(icon, icon_col, label, subtext, self.colors, self.current_query)
-            item.full_path = raw_val
-            item.command_ref = self._make_command(option, search_arg)
-            item.clicked.connect(item.command_ref)
-            
-            self.results_layout.insertWidget(insert_index, item)
-            insert_index += 1
-            self.result_items.append(item)
-        
-        self.selected_index = 0
-        self._update_selection()
+        rows = [self._make_row(option, search_arg) for option in options]
+        self._render_sections([(category or None, rows)])
     
     def _get_item_display(self, option, label, raw_val):
         """Determine icon, color, and subtext for result item."""
@@ -1173,7 +1515,8 @@ class Launcher(QWidget):
             icon, icon_col = "💻", self.colors["icon_code"]
             subtext = self._smart_truncate(raw_val.replace('code "', "").replace('"', ""))
         elif action_type == "file":
-            is_folder = os.path.isdir(raw_val) if os.path.exists(raw_val) else False
+            # Set by the search backend / prioritize_results - no stat per row
+            is_folder = option.get("is_folder", False)
             icon, icon_col = self._get_file_style(label, is_folder, raw_val)
             subtext = self._smart_truncate(raw_val)
         elif action_type == "copy":
@@ -1204,67 +1547,33 @@ class Launcher(QWidget):
     
     def _get_file_style(self, filename, is_folder=False, full_path=""):
         """Get icon and color based on file type."""
-        if is_folder:
-            return "📂", self.colors["icon_folder"]
-        
-        path_lower = full_path.lower()
-        if path_lower.endswith((".exe", ".lnk")):
-            return "🚀", self.colors["icon_app"]
-        
-        ext = filename.split(".")[-1].lower() if "." in filename else ""
-        
-        ext_map = {
-            "icon_image": ["png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp"],
-            "icon_code": ["py", "js", "ts", "html", "css", "json", "jsx", "tsx", "vue", "cpp", "c", "h", "java", "go", "rs"],
-            "icon_doc": ["pdf", "doc", "docx", "txt", "md", "rtf", "odt", "xls", "xlsx"],
-            "icon_zip": ["zip", "rar", "7z", "tar", "gz", "bz2"],
-        }
-        
-        icons = {
-            "icon_image": "🖼️",
-            "icon_code": "📄",
-            "icon_doc": "📝",
-            "icon_zip": "📦",
-        }
-        
-        for color_key, extensions in ext_map.items():
-            if ext in extensions:
-                return icons.get(color_key, "📄"), self.colors.get(color_key, self.colors["icon_default"])
-        
-        return "📄", self.colors["icon_default"]
+        icon, color_key = _file_style(filename, is_folder, full_path.lower())
+        return icon, self.colors.get(color_key, self.colors["icon_default"])
     
     def _smart_truncate(self, path, max_chars=55):
-        """Intelligently truncate long paths."""
-        if not path or len(path) <= max_chars:
-            return path
-        
-        parts = path.replace("\\", "/").split("/")
-        if len(parts) < 4:
-            return path[:max_chars - 3] + "..."
-        
-        return f"{parts[0]}/…/{parts[-2]}/{parts[-1]}"
+        """Intelligently truncate long paths (cached, see module _smart_truncate)."""
+        return _smart_truncate(path, max_chars)
     
-    def _make_command(self, option, search_arg=""):
-        """Create callback function for result item."""
-        def callback():
-            if self.current_query:
-                self.add_to_recent(self.current_query)
-            
-            self._do_hide()
-            if option.get("action_type") == "ocr_trigger":
-                self.snipper = Snipper() 
-                return
-            if "action_type" in option:
-                execute_action({
-                    "type": option["action_type"],
-                    "value": option.get("value", "")
-                })
-            elif "url" in option:
-                url = option["url"]
-                if search_arg:
-                    url += search_arg.replace(" ", "+")
-                execute_action({"type": "url", "value": url})
-        return callback
+    def _invoke_option(self, option, search_arg=""):
+        """Run a result item (bound per row with functools.partial)."""
+        if self.current_query:
+            self.add_to_recent(self.current_query)
+        
+        self._do_hide()
+        if option.get("action_type") == "ocr_trigger":
+            from core.snipper import Snipper
+            self.snipper = Snipper()
+            return
+        if "action_type" in option:
+            execute_action({
+                "type": option["action_type"],
+                "value": option.get("value", "")
+            })
+        elif "url" in option:
+            url = option["url"]
+            if search_arg:
+                url += search_arg.replace(" ", "+")
+            execute_action({"type": "url", "value": url})
 
     # ========================================================================
     #  NAVIGATION - FIXED
@@ -1295,39 +1604,20 @@ class Launcher(QWidget):
         self._updating_selection = True
         
         try:
-            # Update all items
-            for i, item in enumerate(self.result_items):
-                is_selected = (i == self.selected_index)
-                item.set_selected(is_selected)
-                item.set_shortcut_hint("↵ Open" if is_selected else "")
-            
-            # FIX: Force repaint of scroll area viewport
-            self.scroll_area.viewport().update()
-            
-            # Scroll to selected item
-            self._scroll_to_selected()
-            
+            if 0 <= self.selected_index < len(self.result_items):
+                # Only the old and new rows repaint; the delegate draws the hint
+                index = self.results_model.item_index(self.selected_index)
+                if index != self.results_view.currentIndex():
+                    self.results_view.setCurrentIndex(index)
+                    self.results_view.scrollTo(index, QAbstractItemView.ScrollHint.EnsureVisible)
         finally:
             self._updating_selection = False
     
-    def _scroll_to_selected(self):
-        """FIX: Scroll to ensure selected item is visible."""
-        if not (0 <= self.selected_index < len(self.result_items)):
-            return
-        
-        selected_item = self.result_items[self.selected_index]
-        
-        # FIX: Use ensureWidgetVisible for more reliable scrolling
-        self.scroll_area.ensureWidgetVisible(
-            selected_item, 
-            xMargin=0, 
-            yMargin=ITEM_SPACING + 4
-        )
-        
-        # FIX: Force horizontal scroll to 0
-        h_scrollbar = self.scroll_area.horizontalScrollBar()
-        if h_scrollbar.value() != 0:
-            h_scrollbar.setValue(0)
+    def _on_result_clicked(self, index):
+        """Mouse click on a result row runs its command."""
+        command = index.data(ResultsModel.CommandRole)
+        if command:
+            command()
 
     # ========================================================================
     #  ACTIONS
@@ -1336,7 +1626,7 @@ class Launcher(QWidget):
     def on_submit(self):
         """Handle Enter key press."""
         if self.menu_active and 0 <= self.selected_index < len(self.result_items):
-            self.result_items[self.selected_index].command_ref()
+            self.result_items[self.selected_index]["command"]()
             return
         
         query = self.entry.text().strip()
@@ -1345,10 +1635,10 @@ class Launcher(QWidget):
             return
         
         # Calculator
-        if any(c in query for c in "+-*/") and not query.startswith("http"):
-            if re.match(r'^[\d+\-*/().% ]+$', query):
+        if _OP_RE.search(query) and not query.startswith("http"):
+            if _CALC_RE.match(query):
                 try:
-                    result = str(eval(query, {"__builtins__": None}, {}))
+                    result = str(_calc(query))
                     self.entry.setText(result)
                     self.entry.selectAll()
                     return
@@ -1356,22 +1646,20 @@ class Launcher(QWidget):
                     pass
         
         self.last_command = query
-        parts = query.split(" ", 1)
-        cmd = parts[0].lower()
-        arg = parts[1] if len(parts) > 1 else ""
+        # Enter supersedes any live search still waiting to run
+        self._debounce_timer.stop()
+        self._pending_query = None
+        cmd, _, arg = query.partition(" ")
+        cmd = cmd.lower()
         if cmd == "yt" and arg:
+            import webbrowser
             url = f"https://www.youtube.com/results?search_query={arg}"
             webbrowser.open(url)
             self._do_hide()
             return
         if cmd == "p" and arg:
-            results = self.everything.search(f"folder:*{arg}*")
-            if results:
-                self.show_selection_menu([
-                    {"label": r["label"], "value": f'code "{r["value"]}"', "action_type": "cmd"}
-                    for r in results
-                ], category="💻  Projects")
-                return
+            self._search_async("projects", query, f"folder:*{arg}*")
+            return
         
         if cmd in self.mapping:
             action = self.mapping[cmd]
@@ -1384,41 +1672,45 @@ class Launcher(QWidget):
             return
         
         if cmd == "clip":
-            hist = self.clipboard.get_history()
-            if not hist:
+            options = self._clip_options()
+            if not options:
                 self._do_hide()
                 return
-            self.show_selection_menu([
+            self.show_selection_menu(options, category="📋  Clipboard History")
+            return
+        
+        # Enter on plain text: same search, but an empty result says so
+        self._search_async("submit", query, query)
+    
+    def _clip_options(self):
+        """Clipboard history as menu options, rebuilt only when the history changed."""
+        version = self.clipboard.version
+        if version != self._clip_cache_ver:
+            self._clip_cache = [
                 {
-                    "label": h[:50].replace("\n", " ").strip() + ("…" if len(h) > 50 else ""),
+                    "label": h[:50].translate(_NL_TR).strip() + ("…" if len(h) > 50 else ""),
                     "value": h,
                     "action_type": "copy",
                 }
-                for h in hist
-            ], category="📋  Clipboard History")
-            return
-        
-        results = self.everything.search(query)
-        if results:
-            results = self.prioritize_results(results)
-            self.show_categorized_results(results)
-        else:
-            self.show_no_results()
+                for h in self.clipboard.get_history()
+            ]
+            self._clip_cache_ver = version
+        return self._clip_cache
     
     def on_ctrl_submit(self):
         """Ctrl+Enter: Open file location in Explorer."""
         if self.menu_active and 0 <= self.selected_index < len(self.result_items):
-            path = self.result_items[self.selected_index].full_path
-            path = path.replace('code "', "").replace('"', "")
+            path = self.result_items[self.selected_index]["clean_path"]
             if path and os.path.exists(path):
-                subprocess.Popen(f'explorer /select,"{path}"')
+                # argv form: no hand-built quoting for paths with spaces or quotes
+                subprocess.Popen(["explorer.exe", "/select,", path], close_fds=True)
                 self._do_hide()
     
     def on_copy_path(self):
         """Alt+C: Copy selected path to clipboard."""
         if self.menu_active and 0 <= self.selected_index < len(self.result_items):
-            path = self.result_items[self.selected_index].full_path
-            path = path.replace('code "', "").replace('"', "")
+            path = self.result_items[self.selected_index]["clean_path"]
+            import pyperclip
             pyperclip.copy(path)
             
             self.container.set_border_color(self.colors["success"])
@@ -1428,7 +1720,7 @@ class Launcher(QWidget):
         """Tab: Autocomplete with selected item."""
         if self.menu_active and 0 <= self.selected_index < len(self.result_items):
             item = self.result_items[self.selected_index]
-            title = item._label_text
+            title = item["label"]
             self.entry.setText(title)
             self.entry.setCursorPosition(len(title))
     
@@ -0,0 +1,78 @@
+import ctypes
+from ctypes import wintypes
+
+# --- TOOLHELP32 / PROCESS API (no tasklist/taskkill spawns) ---
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+PROCESS_TERMINATE = 0x0001
+MAX_PATH = 260
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_void_p),  # ULONG_PTR
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * MAX_PATH),
+    ]
+
+
+_kernel32 = ctypes.WinDLL("kernel32")
+_kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+_kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+_kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+_kernel32.Process32FirstW.restype = wintypes.BOOL
+_kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+_kernel32.Process32NextW.restype = wintypes.BOOL
+_kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+_kernel32.OpenProcess.restype = wintypes.HANDLE
+_kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+_kernel32.TerminateProcess.restype = wintypes.BOOL
+_kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+_kernel32.CloseHandle.restype = wintypes.BOOL
+
+
+def iter_processes():
+    """Yields (pid, exe_name) for every running process."""
+    snap = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snap or snap == INVALID_HANDLE_VALUE:
+        return
+
+    try:
+        pe = PROCESSENTRY32W()
+        pe.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = _kernel32.Process32FirstW(snap, ctypes.byref(pe))
+        while ok:
+            yield pe.th32ProcessID, pe.szExeFile
+            ok = _kernel32.Process32NextW(snap, ctypes.byref(pe))
+    finally:
+        _kernel32.CloseHandle(snap)
+
+
+def find_pids(exe_name):
+    """Returns the PIDs of all processes named `exe_name` (case-insensitive)."""
+    exe_name = exe_name.lower()
+    return [pid for pid, name in iter_processes() if name.lower() == exe_name]
+
+
+def is_running(exe_name):
+    """Checks the process list for `exe_name` (case-insensitive)."""
+    exe_name = exe_name.lower()
+    return any(name.lower() == exe_name for _, name in iter_processes())
+
+
+def terminate(pid):
+    """Kills a process by PID. Returns False if it can't be opened or killed."""
+    handle = _kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
+    if not handle:
+        return False
+    try:
+        return bool(_kernel32.TerminateProcess(handle, 1))
+    finally:
+        _kernel32.CloseHandle(handle)
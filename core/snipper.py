@@ -1,64 +1,83 @@
 import sys
 import asyncio
 import os
-import io
+import threading
 from PyQt6.QtWidgets import QApplication, QWidget, QRubberBand
-from PyQt6.QtCore import Qt, QPoint, QRect, QThread, pyqtSignal, QBuffer, QIODevice
-from PyQt6.QtGui import QPainter, QColor, QGuiApplication
+from PyQt6.QtCore import Qt, QPoint, QRect, QThread, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QGuiApplication, QImage
 
-# Image Processing
-from PIL import Image, ImageOps
-
-# Windows Native OCR Imports
-from winsdk.windows.media.ocr import OcrEngine
-from winsdk.windows.graphics.imaging import BitmapDecoder
-from winsdk.windows.storage.streams import InMemoryRandomAccessStream, DataWriter
+# Windows Native OCR (winsdk) is imported in recognize_text, after the
+# overlay is already up, on the OCR loop thread
 
 class OCRWorker(QThread):
     finished = pyqtSignal(str, bool)
 
-    def __init__(self, image_data):
+    # One event loop for every capture, running on its own daemon thread
+    _loop = None
+    _loop_lock = threading.Lock()
+    # OcrEngine, created once on the loop thread (see recognize_text)
+    _engine = None
+
+    @classmethod
+    def _get_loop(cls):
+        with cls._loop_lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                threading.Thread(target=cls._loop.run_forever, daemon=True).start()
+            return cls._loop
+
+    def __init__(self, image):
         super().__init__()
-        self.image_data = image_data
+        # QImage (not QPixmap) so it can be processed off the GUI thread
+        self.image = image
 
     def run(self):
         try:
-            # 1. Preprocessing (Grayscale + Scaling)
-            pil_img = Image.open(io.BytesIO(self.image_data))
-            pil_img = ImageOps.grayscale(pil_img)
-            
-            width, height = pil_img.size
-            new_size = (width * 2, height * 2)
-            pil_img = pil_img.resize(new_size, Image.Resampling.LANCZOS)
+            # 1. Preprocessing (Grayscale + Scaling), on one Qt pixel buffer
+            img = self.image.convertToFormat(QImage.Format.Format_Grayscale8)
+            img = img.scaled(
+                img.width() * 2, img.height() * 2,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            width, height = img.width(), img.height()
             
-            byte_arr = io.BytesIO()
-            pil_img.save(byte_arr, format='PNG')
-            processed_bytes = byte_arr.getvalue()
+            # Raw Gray8 pixels, no PNG encode/decode. SoftwareBitmap wants
+            # tightly packed rows; QImage pads each scanline to 4 bytes.
+            stride = img.bytesPerLine()
+            pixels = img.constBits().asstring(img.sizeInBytes())
+            if stride != width:
+                pixels = b"".join(pixels[y * stride:y * stride + width] for y in range(height))
 
             # 2. Run Async OCR
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            text = loop.run_until_complete(self.recognize_text(processed_bytes))
-            loop.close()
+            text = asyncio.run_coroutine_threadsafe(
+                self.recognize_text(pixels, width, height), self._get_loop()
+            ).result()
             
             self.finished.emit(text, True)
             
         except Exception as e:
             self.finished.emit(f"Error: {str(e)}", False)
 
-    async def recognize_text(self, data):
-        stream = InMemoryRandomAccessStream()
-        writer = DataWriter(stream)
-        writer.write_bytes(data)
-        await writer.store_async()
-        stream.seek(0)
-
-        decoder = await BitmapDecoder.create_async(stream)
-        bitmap = await decoder.get_software_bitmap_async()
-
-        engine = OcrEngine.try_create_from_user_profile_languages()
-        if not engine:
-            return "Error: No OCR language pack found."
+    async def recognize_text(self, pixels, width, height):
+        from winsdk.windows.media.ocr import OcrEngine
+        from winsdk.windows.graphics.imaging import SoftwareBitmap, BitmapPixelFormat
+        from winsdk.windows.storage.streams import DataWriter
+
+        # Wrap the Gray8 pixels in an IBuffer (no stream needed)
+        writer = DataWriter()
+        writer.write_bytes(pixels)
+        bitmap = SoftwareBitmap.create_copy_from_buffer(
+            writer.detach_buffer(), BitmapPixelFormat.GRAY8, width, height
+        )
+
+        # Only ever touched from the loop thread, so no lock needed
+        engine = OCRWorker._engine
+        if engine is None:
+            engine = OcrEngine.try_create_from_user_profile_languages()
+            if not engine:
+                return "Error: No OCR language pack found."
+            OCRWorker._engine = engine
 
         result = await engine.recognize_async(bitmap)
         
@@ -86,6 +105,12 @@ class Snipper(QWidget):
         
         self.pixel_ratio = self.screenshot.width() / self.virtual_geometry.width()
 
+        # Dimmed copy built once, so a repaint is a single blit per area
+        self.darkened = self.screenshot.copy()
+        painter = QPainter(self.darkened)
+        painter.fillRect(self.darkened.rect(), QColor(0, 0, 0, 100))
+        painter.end()
+
         self.begin = QPoint()
         self.end = QPoint()
         self.is_snipping = False
@@ -99,20 +124,24 @@ class Snipper(QWidget):
             geometry = geometry.united(screen.geometry())
         return geometry
 
+    def to_source(self, rect):
+        """Maps a widget rect to the matching rect in screenshot pixels."""
+        return QRect(
+            int(rect.x() * self.pixel_ratio),
+            int(rect.y() * self.pixel_ratio),
+            int(rect.width() * self.pixel_ratio),
+            int(rect.height() * self.pixel_ratio),
+        )
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.drawPixmap(self.rect(), self.screenshot)
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 100))
+        # Only the dirty area, not the whole virtual desktop
+        dirty = event.rect()
+        painter.drawPixmap(dirty, self.darkened, self.to_source(dirty))
         
         if self.is_snipping and not self.rubberband.geometry().isEmpty():
             rect = self.rubberband.geometry()
-            src_x = int(rect.x() * self.pixel_ratio)
-            src_y = int(rect.y() * self.pixel_ratio)
-            src_w = int(rect.width() * self.pixel_ratio)
-            src_h = int(rect.height() * self.pixel_ratio)
-            source_rect = QRect(src_x, src_y, src_w, src_h)
-
-            painter.drawPixmap(rect, self.screenshot, source_rect)
+            painter.drawPixmap(rect, self.screenshot, self.to_source(rect))
             painter.setPen(QColor(0, 255, 65))
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawRect(rect)
@@ -128,9 +157,15 @@ class Snipper(QWidget):
         self.is_snipping = True
 
     def mouseMoveEvent(self, event):
+        # High-rate mice report many moves per pixel; only a new pixel matters
+        if event.pos() == self.end:
+            return
         self.end = event.pos()
-        self.rubberband.setGeometry(QRect(self.begin, self.end).normalized())
-        self.update()
+        old_rect = self.rubberband.geometry()
+        new_rect = QRect(self.begin, self.end).normalized()
+        self.rubberband.setGeometry(new_rect)
+        # Old + new selection (plus the 1px outline) is all that changed
+        self.update(old_rect.united(new_rect).adjusted(-2, -2, 2, 2))
 
     def mouseReleaseEvent(self, event):
         self.is_snipping = False
@@ -143,19 +178,10 @@ class Snipper(QWidget):
             self.close()
 
     def process_ocr(self, geometry_rect):
-        x = int(geometry_rect.x() * self.pixel_ratio)
-        y = int(geometry_rect.y() * self.pixel_ratio)
-        w = int(geometry_rect.width() * self.pixel_ratio)
-        h = int(geometry_rect.height() * self.pixel_ratio)
-        
-        img_rect = QRect(x, y, w, h).intersected(self.screenshot.rect())
-        cropped = self.screenshot.copy(img_rect)
-        
-        byte_array = QBuffer()
-        byte_array.open(QIODevice.OpenModeFlag.WriteOnly)
-        cropped.save(byte_array, "PNG")
+        img_rect = self.to_source(geometry_rect).intersected(self.screenshot.rect())
+        cropped = self.screenshot.copy(img_rect).toImage()
         
-        self.worker = OCRWorker(byte_array.data())
+        self.worker = OCRWorker(cropped)
         self.worker.finished.connect(self.on_ocr_complete)
         self.worker.start()
 
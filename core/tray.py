@@ -3,8 +3,15 @@ from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QBrush
 from PyQt6.QtCore import Qt, QSize
 import sys
 
+# Rendered on first use, then shared
+_ICON_CACHE = None
+
 def create_programmatic_icon():
     """Generates a QIcon programmatically (Dark square with cyan dot)"""
+    global _ICON_CACHE
+    if _ICON_CACHE is not None:
+        return _ICON_CACHE
+    
     # Create a 64x64 pixmap
     pixmap = QPixmap(64, 64)
     pixmap.fill(Qt.GlobalColor.transparent)
@@ -26,7 +33,8 @@ def create_programmatic_icon():
     painter.drawEllipse(16, 16, 32, 32)
     
     painter.end()
-    return QIcon(pixmap)
+    _ICON_CACHE = QIcon(pixmap)
+    return _ICON_CACHE
 
 class SystemTray:
     def __init__(self, app, quit_callback):
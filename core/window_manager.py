@@ -2,16 +2,19 @@ import win32gui
 import win32con
 import win32api
 import win32process
+import atexit
 import ctypes
 from ctypes import windll, wintypes
 import time
 import json
+import sys
 import logging
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Tuple, Callable
+from dataclasses import asdict, dataclass, field
+from typing import Optional, Dict, FrozenSet, List, Tuple, Callable
 from enum import Enum, auto
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import threading
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -36,6 +39,91 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Own WinDLL instance: prototypes here don't leak into other windll users.
+# Hot-path calls (tile/animate) go straight through ctypes, not pywin32.
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_user32.MoveWindow.argtypes = [
+    wintypes.HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.BOOL,
+]
+_user32.MoveWindow.restype = wintypes.BOOL
+_user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+_user32.GetWindowRect.restype = wintypes.BOOL
+_user32.BeginDeferWindowPos.argtypes = [ctypes.c_int]
+_user32.BeginDeferWindowPos.restype = wintypes.HANDLE
+_user32.DeferWindowPos.argtypes = [
+    wintypes.HANDLE, wintypes.HWND, wintypes.HWND,
+    ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT,
+]
+_user32.DeferWindowPos.restype = wintypes.HANDLE
+_user32.EndDeferWindowPos.argtypes = [wintypes.HANDLE]
+_user32.EndDeferWindowPos.restype = wintypes.BOOL
+_user32.RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+_user32.RegisterHotKey.restype = wintypes.BOOL
+_user32.UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+_user32.UnregisterHotKey.restype = wintypes.BOOL
+_user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+_user32.GetMessageW.restype = wintypes.BOOL
+_user32.PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+_user32.PostThreadMessageW.restype = wintypes.BOOL
+_user32.ShowWindowAsync.argtypes = [wintypes.HWND, ctypes.c_int]
+_user32.ShowWindowAsync.restype = wintypes.BOOL
+_user32.IsZoomed.argtypes = [wintypes.HWND]
+_user32.IsZoomed.restype = wintypes.BOOL
+_user32.IsWindowVisible.argtypes = [wintypes.HWND]
+_user32.IsWindowVisible.restype = wintypes.BOOL
+WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+_user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+_user32.EnumWindows.restype = wintypes.BOOL
+
+# System timer resolution, raised to 1ms while animations run
+_winmm = ctypes.WinDLL("winmm")
+_winmm.timeBeginPeriod.argtypes = [wintypes.UINT]
+_winmm.timeEndPeriod.argtypes = [wintypes.UINT]
+
+DWMWA_EXTENDED_FRAME_BOUNDS = 9
+_dwmapi = ctypes.WinDLL("dwmapi")
+_dwmapi.DwmGetWindowAttribute.argtypes = [
+    wintypes.HWND, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD,
+]
+_dwmapi.DwmGetWindowAttribute.restype = ctypes.HRESULT  # Raises OSError on failure
+
+
+def _get_frame_bounds(hwnd: int) -> Optional[Tuple[int, int, int, int]]:
+    """Visible bounds (left, top, right, bottom) without DWM's invisible borders, or None"""
+    rect = wintypes.RECT()
+    try:
+        _dwmapi.DwmGetWindowAttribute(
+            hwnd, DWMWA_EXTENDED_FRAME_BOUNDS, ctypes.byref(rect), ctypes.sizeof(rect)
+        )
+    except OSError:  # Failed HRESULT (e.g. DWM off, window gone)
+        return None
+    return (rect.left, rect.top, rect.right, rect.bottom)
+
+
+def _get_window_rect(hwnd: int) -> Tuple[int, int, int, int]:
+    """GetWindowRect as (left, top, right, bottom); raises like pywin32 on failure"""
+    rect = wintypes.RECT()
+    if not _user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return (rect.left, rect.top, rect.right, rect.bottom)
+
+
+# hwnd -> interned class name. A window's class never changes, and the few
+# common names (Chrome_WidgetWin_1, ...) are shared by many hwnds.
+_class_cache: Dict[int, str] = {}
+_CLASS_CACHE_MAX = 512
+
+
+def _get_class_name(hwnd: int) -> str:
+    """GetClassName, cached per hwnd; dead hwnds are pruned when the cache fills up"""
+    name = _class_cache.get(hwnd)
+    if name is None:
+        if len(_class_cache) >= _CLASS_CACHE_MAX:
+            for dead in [h for h in _class_cache if not win32gui.IsWindow(h)]:
+                del _class_cache[dead]
+        name = _class_cache[hwnd] = sys.intern(win32gui.GetClassName(hwnd))
+    return name
+
 # ══════════════════════════════════════════════════════════════════════════════
 # DATA CLASSES & ENUMS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -54,8 +142,12 @@ class TileMode(Enum):
     CENTER = auto()
     CENTER_SMALL = auto()
 
+# Rect and WindowInfo are created per animation frame / enumerated window:
+# __slots__ drops the per-instance __dict__. (Classes with field defaults
+# can't declare them by hand, so the rest stay as they are.)
 @dataclass
 class Rect:
+    __slots__ = ("x", "y", "width", "height")
     x: int
     y: int
     width: int
@@ -70,6 +162,10 @@ class Rect:
 
 @dataclass
 class WindowInfo:
+    __slots__ = (
+        "hwnd", "title", "class_name", "rect", "process_id",
+        "is_visible", "is_minimized", "is_maximized",
+    )
     hwnd: int
     title: str
     class_name: str
@@ -106,7 +202,8 @@ class Config:
     animation_duration_ms: int = 150
     animation_steps: int = 10
     history_size: int = 50
-    excluded_classes: List[str] = field(
+    # Lists in JSON, frozensets in memory (see __post_init__)
+    excluded_classes: FrozenSet[str] = field(
         default_factory=lambda: [
             "Shell_TrayWnd",
             "Progman",
@@ -115,10 +212,15 @@ class Config:
             "ApplicationFrameWindow",
         ]
     )
-    excluded_titles: List[str] = field(
+    excluded_titles: FrozenSet[str] = field(
         default_factory=lambda: ["Program Manager", "Windows Input Experience"]
     )
 
+    def __post_init__(self):
+        # Checked for every enumerated window: hash lookups, not list scans
+        self.excluded_classes = frozenset(self.excluded_classes)
+        self.excluded_titles = frozenset(self.excluded_titles)
+
     @classmethod
     def load(cls, path: str = "wm_config.json") -> "Config":
         try:
@@ -130,12 +232,15 @@ class Config:
             config.save(path)
             return config
         except Exception as e:
-            logger.warning(f"Failed to load config: {e}, using defaults")
+            logger.warning("Failed to load config: %s, using defaults", e)
             return cls()
 
     def save(self, path: str = "wm_config.json") -> None:
+        data = dict(self.__dict__)
+        data["excluded_classes"] = sorted(self.excluded_classes)
+        data["excluded_titles"] = sorted(self.excluded_titles)
         with open(path, "w") as f:
-            json.dump(self.__dict__, f, indent=2)
+            json.dump(data, f, indent=2)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # MONITOR MANAGER
@@ -144,12 +249,47 @@ class Config:
 class MonitorManager:
     """Handle multi-monitor setups"""
 
+    WM_DPICHANGED = 0x02E0
+    SPI_SETWORKAREA = 0x002F
+
     def __init__(self):
         self._monitors: List[MonitorInfo] = []
+        self._by_handle: Dict[int, MonitorInfo] = {}
+        self._dirty = False
         self._refresh()
+        # Layout is cached until Windows reports a display/work-area change
+        threading.Thread(target=self._watch_display_changes, daemon=True).start()
+
+    def _watch_display_changes(self) -> None:
+        """Hidden top-level window: receives the WM_DISPLAYCHANGE broadcast"""
+        try:
+            wc = win32gui.WNDCLASS()
+            wc.lpfnWndProc = self._wnd_proc
+            wc.hInstance = win32api.GetModuleHandle(None)
+            wc.lpszClassName = "SynapseDisplayWatcher"
+            win32gui.RegisterClass(wc)
+            # Not HWND_MESSAGE: message-only windows don't get broadcasts
+            win32gui.CreateWindow(
+                wc.lpszClassName, "", 0, 0, 0, 0, 0, 0, 0, wc.hInstance, None
+            )
+            win32gui.PumpMessages()
+        except Exception as e:
+            logger.error("Display change watcher failed: %s", e)
+
+    def _wnd_proc(self, hwnd, msg, wparam, lparam):
+        if (
+            msg in (win32con.WM_DISPLAYCHANGE, self.WM_DPICHANGED)
+            or (msg == win32con.WM_SETTINGCHANGE and wparam == self.SPI_SETWORKAREA)
+        ):
+            self._dirty = True
+            WindowUtils.invalidate()  # Borders scale with DPI
+            return 0
+        return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
 
     def _refresh(self):
-        self._monitors.clear()
+        self._dirty = False
+        # Built aside and swapped in, so readers never see a half-filled list
+        monitors: List[MonitorInfo] = []
         try:
             monitor_handles = win32api.EnumDisplayMonitors(None, None)
             for hMonitor, hdcMonitor, pyRect in monitor_handles:
@@ -170,15 +310,18 @@ class MonitorManager:
                         is_primary=is_primary,
                         dpi_scale=self._get_dpi_scale(hMonitor)
                     )
-                    self._monitors.append(monitor)
+                    monitors.append(monitor)
                 except Exception as e:
-                    logger.error(f"Error processing monitor {hMonitor}: {e}")
+                    logger.error("Error processing monitor %s: %s", hMonitor, e)
 
-            self._monitors.sort(key=lambda m: m.work_area.x)
-            logger.info(f"Refreshed: Found {len(self._monitors)} monitors")
+            monitors.sort(key=lambda m: m.work_area.x)
+            # int(): pywin32 hands out PyHANDLE objects, keyed by their value
+            self._by_handle = {int(m.handle): m for m in monitors}
+            self._monitors = monitors
+            logger.info("Refreshed: Found %s monitors", len(monitors))
 
         except Exception as e:
-            logger.error(f"Failed to refresh monitors: {e}")
+            logger.error("Failed to refresh monitors: %s", e)
 
     def _get_dpi_scale(self, hMonitor) -> float:
         try:
@@ -193,39 +336,44 @@ class MonitorManager:
 
     @property
     def monitors(self) -> List[MonitorInfo]:
-        if not self._monitors:
+        if self._dirty:
             self._refresh()
         return self._monitors
 
     @property
     def primary(self) -> Optional[MonitorInfo]:
-        return next((m for m in self._monitors if m.is_primary), self._monitors[0] if self._monitors else None)
+        monitors = self.monitors
+        return next((m for m in monitors if m.is_primary), monitors[0] if monitors else None)
 
     def get_monitor_for_window(self, hwnd: int) -> Optional[MonitorInfo]:
         try:
             hMonitor = win32api.MonitorFromWindow(
                 hwnd, win32con.MONITOR_DEFAULTTONEAREST)
-            return next((m for m in self._monitors if m.handle == hMonitor), self.primary)
+            if self._dirty:
+                self._refresh()
+            return self._by_handle.get(int(hMonitor)) or self.primary
         except:
             return self.primary
 
     def get_next_monitor(self, current: MonitorInfo) -> MonitorInfo:
-        if not self._monitors:
+        monitors = self.monitors
+        if not monitors:
             return current
         try:
-            idx = self._monitors.index(current)
-            return self._monitors[(idx + 1) % len(self._monitors)]
+            idx = monitors.index(current)
+            return monitors[(idx + 1) % len(monitors)]
         except:
-            return self._monitors[0]
+            return monitors[0]
 
     def get_prev_monitor(self, current: MonitorInfo) -> MonitorInfo:
-        if not self._monitors:
+        monitors = self.monitors
+        if not monitors:
             return current
         try:
-            idx = self._monitors.index(current)
-            return self._monitors[(idx - 1) % len(self._monitors)]
+            idx = monitors.index(current)
+            return monitors[(idx - 1) % len(monitors)]
         except:
-            return self._monitors[0]
+            return monitors[0]
 
 # ══════════════════════════════════════════════════════════════════════════════
 # WINDOW UTILITIES
@@ -233,38 +381,68 @@ class MonitorManager:
 
 class WindowUtils:
     """Static utility methods for window operations"""
-    DWMWA_EXTENDED_FRAME_BOUNDS = 9
+    DWMWA_EXTENDED_FRAME_BOUNDS = DWMWA_EXTENDED_FRAME_BOUNDS
+    OFFSETS_TTL = 2.0  # seconds
+    OFFSETS_CACHE_MAX = 64
+
+    # hwnd -> (offsets, monotonic time). Borders only change with the
+    # window's style (maximize/restore) or DPI (monitor change).
+    _offsets_cache: Dict[int, Tuple[Tuple[int, int, int, int], float]] = {}
+    _offsets_lock = threading.Lock()  # tile_all_visible fills it from a pool
 
     @staticmethod
     def get_extended_frame_offsets(hwnd: int) -> Tuple[int, int, int, int]:
         """Get invisible border offsets (left, top, right, bottom)"""
-        rect = wintypes.RECT()
+        now = time.monotonic()
+        cached = WindowUtils._offsets_cache.get(hwnd)
+        if cached and now - cached[1] < WindowUtils.OFFSETS_TTL:
+            return cached[0]
+
         try:
-            windll.dwmapi.DwmGetWindowAttribute(
-                wintypes.HWND(hwnd),
-                ctypes.c_int(WindowUtils.DWMWA_EXTENDED_FRAME_BOUNDS),
-                ctypes.byref(rect),
-                ctypes.sizeof(rect),
-            )
-            l, t, r, b = win32gui.GetWindowRect(hwnd)
-            return (rect.left - l, 0, r - rect.right, b - rect.bottom)
+            bounds = _get_frame_bounds(hwnd)
+            if bounds is None:
+                return (0, 0, 0, 0)
+            l, t, r, b = _get_window_rect(hwnd)
+            offsets = (bounds[0] - l, 0, r - bounds[2], b - bounds[3])
         except Exception as e:
-            logger.debug(f"Could not get frame bounds: {e}")
+            logger.debug("Could not get frame bounds: %s", e)
             return (0, 0, 0, 0)
 
+        cache = WindowUtils._offsets_cache
+        with WindowUtils._offsets_lock:
+            if len(cache) >= WindowUtils.OFFSETS_CACHE_MAX:
+                # Drop closed windows (handles can be reused) and expired entries
+                for stale in [h for h, (_, ts) in cache.items()
+                              if now - ts >= WindowUtils.OFFSETS_TTL or not win32gui.IsWindow(h)]:
+                    del cache[stale]
+            cache[hwnd] = (offsets, now)
+        return offsets
+
+    @staticmethod
+    def invalidate(hwnd: Optional[int] = None) -> None:
+        """Forget cached frame offsets for one window (or all)"""
+        # Pool workers and the display watcher call this while others prune
+        with WindowUtils._offsets_lock:
+            if hwnd is None:
+                WindowUtils._offsets_cache.clear()
+            else:
+                WindowUtils._offsets_cache.pop(hwnd, None)
+
     @staticmethod
     def get_window_info(hwnd: int) -> Optional[WindowInfo]:
         """Get comprehensive window information"""
         try:
             if not win32gui.IsWindow(hwnd):
                 return None
-            rect = win32gui.GetWindowRect(hwnd)
+            # Visible bounds: what tiling targets and history/layouts store.
+            # GetWindowRect (with invisible borders) only if DWM can't answer.
+            rect = _get_frame_bounds(hwnd) or _get_window_rect(hwnd)
             placement = win32gui.GetWindowPlacement(hwnd)
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
             return WindowInfo(
                 hwnd=hwnd,
                 title=win32gui.GetWindowText(hwnd),
-                class_name=win32gui.GetClassName(hwnd),
+                class_name=_get_class_name(hwnd),
                 rect=Rect.from_ltrb(*rect),
                 process_id=pid,
                 is_visible=win32gui.IsWindowVisible(hwnd),
@@ -272,20 +450,38 @@ class WindowUtils:
                 is_maximized=placement[1] == win32con.SW_SHOWMAXIMIZED,
             )
         except Exception as e:
-            logger.debug(f"Failed to get window info for {hwnd}: {e}")
+            logger.debug("Failed to get window info for %s: %s", hwnd, e)
             return None
 
     @staticmethod
-    def enumerate_windows(filter_func: Optional[Callable[[WindowInfo], bool]] = None) -> List[WindowInfo]:
-        """Get all windows, optionally filtered"""
+    def enumerate_windows(
+        filter_func: Optional[Callable[[WindowInfo], bool]] = None,
+        prefilter: Optional[Callable[[int], bool]] = None,
+    ) -> List[WindowInfo]:
+        """
+        Get all visible windows, optionally filtered.
+        `prefilter(hwnd)` runs before the full WindowInfo is built, so cheap
+        rejections skip the placement/pid/text queries.
+        """
         windows = []
+        @WNDENUMPROC
         def callback(hwnd, _):
-            info = WindowUtils.get_window_info(hwnd)
-            if info and info.is_visible:
-                if filter_func is None or filter_func(info):
-                    windows.append(info)
+            # ctypes swallows callback exceptions and returns 0, which would
+            # silently stop EnumWindows: skip the window and carry on instead
+            try:
+                # Hidden windows are the vast majority: reject them first
+                if not _user32.IsWindowVisible(hwnd):
+                    return True
+                if prefilter is not None and not prefilter(hwnd):
+                    return True
+                info = WindowUtils.get_window_info(hwnd)
+                if info and info.is_visible:
+                    if filter_func is None or filter_func(info):
+                        windows.append(info)
+            except Exception as e:  # e.g. the window closed mid-enumeration
+                logger.debug("Skipping window %s during enumeration: %s", hwnd, e)
             return True
-        win32gui.EnumWindows(callback, None)
+        _user32.EnumWindows(callback, 0)
         return windows
 
     @staticmethod
@@ -297,7 +493,7 @@ class WindowUtils:
             )
             return True
         except Exception as e:
-            logger.error(f"Failed to set always on top: {e}")
+            logger.error("Failed to set always on top: %s", e)
             return False
 
     @staticmethod
@@ -311,7 +507,7 @@ class WindowUtils:
                 hwnd, 0, alpha, 0x02)  # LWA_ALPHA
             return True
         except Exception as e:
-            logger.error(f"Failed to set transparency: {e}")
+            logger.error("Failed to set transparency: %s", e)
             return False
 
     @staticmethod
@@ -322,7 +518,7 @@ class WindowUtils:
             win32gui.SetForegroundWindow(hwnd)
             return True
         except Exception as e:
-            logger.error(f"Failed to focus window: {e}")
+            logger.error("Failed to focus window: %s", e)
             return False
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -332,6 +528,59 @@ class WindowUtils:
 class LayoutCalculator:
     """Calculate layout rectangles"""
 
+    # mode -> (x, y, w, h, uw, uh, gap, margin) -> Rect, where uw/uh are the
+    # work area minus margins. Only the requested rect is computed.
+    _LAYOUTS: Dict[TileMode, Callable[..., Rect]] = {
+        # Halves
+        TileMode.LEFT_HALF: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + margin, y + margin, (uw - gap) // 2, uh
+        ),
+        TileMode.RIGHT_HALF: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + margin + (uw + gap) // 2, y + margin, (uw - gap) // 2, uh
+        ),
+        TileMode.TOP_HALF: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + margin, y + margin, uw, (uh - gap) // 2
+        ),
+        TileMode.BOTTOM_HALF: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + margin, y + margin + (uh + gap) // 2, uw, (uh - gap) // 2
+        ),
+        # Thirds
+        TileMode.LEFT_THIRD: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + margin, y + margin, (uw - gap * 2) // 3, uh
+        ),
+        TileMode.CENTER_THIRD: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + margin + (uw - gap * 2) // 3 + gap,
+            y + margin,
+            (uw - gap * 2) // 3,
+            uh,
+        ),
+        TileMode.RIGHT_THIRD: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + margin + 2 * ((uw - gap * 2) // 3 + gap),
+            y + margin,
+            (uw - gap * 2) // 3,
+            uh,
+        ),
+        TileMode.LEFT_TWO_THIRDS: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + margin, y + margin, 2 * (uw - gap * 2) // 3 + gap, uh
+        ),
+        TileMode.RIGHT_TWO_THIRDS: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + margin + (uw - gap * 2) // 3 + gap,
+            y + margin,
+            2 * (uw - gap * 2) // 3 + gap,
+            uh,
+        ),
+        # Special
+        TileMode.MAXIMIZE: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + margin, y + margin, uw, uh
+        ),
+        TileMode.CENTER: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + int(w * 0.15), y + int(h * 0.1), int(w * 0.7), int(h * 0.8)
+        ),
+        TileMode.CENTER_SMALL: lambda x, y, w, h, uw, uh, gap, margin: Rect(
+            x + int(w * 0.25), y + int(h * 0.2), int(w * 0.5), int(h * 0.6)
+        ),
+    }
+
     def __init__(self, config: Config):
         self.config = config
 
@@ -346,49 +595,7 @@ class LayoutCalculator:
         uw = w - (margin * 2)
         uh = h - (margin * 2)
 
-        layouts = {
-            # Halves
-            TileMode.LEFT_HALF: Rect(x + margin, y + margin, (uw - gap) // 2, uh),
-            TileMode.RIGHT_HALF: Rect(
-                x + margin + (uw + gap) // 2, y + margin, (uw - gap) // 2, uh
-            ),
-            TileMode.TOP_HALF: Rect(x + margin, y + margin, uw, (uh - gap) // 2),
-            TileMode.BOTTOM_HALF: Rect(
-                x + margin, y + margin + (uh + gap) // 2, uw, (uh - gap) // 2
-            ),
-            # Thirds
-            TileMode.LEFT_THIRD: Rect(x + margin, y + margin, (uw - gap * 2) // 3, uh),
-            TileMode.CENTER_THIRD: Rect(
-                x + margin + (uw - gap * 2) // 3 + gap,
-                y + margin,
-                (uw - gap * 2) // 3,
-                uh,
-            ),
-            TileMode.RIGHT_THIRD: Rect(
-                x + margin + 2 * ((uw - gap * 2) // 3 + gap),
-                y + margin,
-                (uw - gap * 2) // 3,
-                uh,
-            ),
-            TileMode.LEFT_TWO_THIRDS: Rect(
-                x + margin, y + margin, 2 * (uw - gap * 2) // 3 + gap, uh
-            ),
-            TileMode.RIGHT_TWO_THIRDS: Rect(
-                x + margin + (uw - gap * 2) // 3 + gap,
-                y + margin,
-                2 * (uw - gap * 2) // 3 + gap,
-                uh,
-            ),
-            # Special
-            TileMode.MAXIMIZE: Rect(x + margin, y + margin, uw, uh),
-            TileMode.CENTER: Rect(
-                x + int(w * 0.15), y + int(h * 0.1), int(w * 0.7), int(h * 0.8)
-            ),
-            TileMode.CENTER_SMALL: Rect(
-                x + int(w * 0.25), y + int(h * 0.2), int(w * 0.5), int(h * 0.6)
-            ),
-        }
-        return layouts[mode]
+        return self._LAYOUTS[mode](x, y, w, h, uw, uh, gap, margin)
 
     def calculate_grid(self, row: int, col: int, rows: int, cols: int, work_area: Rect) -> Rect:
         """Calculate rectangle for grid position"""
@@ -405,6 +612,18 @@ class LayoutCalculator:
             cell_h,
         )
 
+    def calculate_grid_all(self, rows: int, cols: int, work_area: Rect) -> List[Rect]:
+        """All rows*cols grid cells in row-major order (same math as calculate_grid)"""
+        gap = self.config.gap
+        margin = self.config.margin
+        uw = work_area.width - (margin * 2) - (gap * (cols - 1))
+        uh = work_area.height - (margin * 2) - (gap * (rows - 1))
+        cell_w = uw // cols
+        cell_h = uh // rows
+        xs = [work_area.x + margin + col * (cell_w + gap) for col in range(cols)]
+        ys = [work_area.y + margin + row * (cell_h + gap) for row in range(rows)]
+        return [Rect(x, y, cell_w, cell_h) for y in ys for x in xs]
+
 # ══════════════════════════════════════════════════════════════════════════════
 # ANIMATION ENGINE
 # ══════════════════════════════════════════════════════════════════════════════
@@ -414,41 +633,160 @@ class AnimationEngine:
 
     def __init__(self, config: Config):
         self.config = config
+        self._eased: Tuple[float, ...] = ()
+        # hwnd -> [start, end, offsets, frame index, last rect], shared with
+        # the animation thread; _cond guards it and wakes the idle thread
+        self._active: Dict[int, list] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def _eased_steps(self, steps: int) -> Tuple[float, ...]:
+        """Eased progress for frames 1..steps, rebuilt only if steps changes"""
+        if len(self._eased) != steps:
+            self._eased = tuple(self._ease_out_cubic(i / steps) for i in range(1, steps + 1))
+        return self._eased
 
     def animate(self, hwnd: int, start: Rect, end: Rect, offsets: Tuple[int, int, int, int]) -> None:
-        """Animate window from start to end position"""
+        """
+        Animate window from start to end position. Returns immediately: the
+        frames run on the shared animation thread (see _run).
+        """
         if not self.config.animation_enabled:
-            self._apply_position(hwnd, end, offsets)
+            if start != end:  # Already in place: skip the redundant move
+                self._apply_position(hwnd, end, offsets)
             return
 
-        steps = self.config.animation_steps
-        duration = self.config.animation_duration_ms / 1000.0
-        step_time = duration / steps
-
-        for i in range(1, steps + 1):
-            t = self._ease_out_cubic(i / steps)
-            current = Rect(
-                int(start.x + (end.x - start.x) * t),
-                int(start.y + (end.y - start.y) * t),
-                int(start.width + (end.width - start.width) * t),
-                int(start.height + (end.height - start.height) * t),
-            )
-            self._apply_position(hwnd, current, offsets)
-            time.sleep(step_time)
+        with self._cond:
+            # Replaces any animation of this window still in flight
+            self._active[hwnd] = [start, end, offsets, 0, start]
+            self._cond.notify()
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="wm-animation", daemon=True)
+                self._thread.start()
+
+    def cancel(self, hwnd: int) -> None:
+        """
+        Stop hwnd's animation. No frame of it is applied after this returns,
+        so a synchronous move that follows (undo) sticks.
+        """
+        with self._cond:
+            self._active.pop(hwnd, None)
+
+    def pending_target(self, hwnd: int) -> Optional[Rect]:
+        """Where hwnd's in-flight animation will leave it, or None"""
+        with self._cond:
+            job = self._active.get(hwnd)
+            return job[1] if job else None
+
+    def _run(self) -> None:
+        """
+        Animation worker. Every in-flight animation advances one frame per
+        tick and all of a tick's frames go out as one DeferWindowPos batch.
+        A new job for a window that is still moving replaces the old one.
+        Frames that land on the same pixels as the window's last one are
+        skipped (the eased tail, or a window that is already in place).
+        """
+        active = self._active
+        hires = False
+        next_tick = 0.0
+        while True:
+            with self._cond:
+                if not active:
+                    if hires:
+                        _winmm.timeEndPeriod(1)
+                        hires = False
+                    # Idle: block until there's work, then raise the timer
+                    # resolution so sleeps aren't rounded up to ~15ms
+                    while not active:
+                        self._cond.wait()
+                    _winmm.timeBeginPeriod(1)
+                    hires = True
+                    next_tick = time.perf_counter()
+
+                steps = self.config.animation_steps
+                eased = self._eased_steps(steps)
+                moves = []
+                for hwnd, job in list(active.items()):
+                    start, end, offsets, frame, last = job
+                    t = eased[min(frame, steps - 1)]
+                    rect = Rect(
+                        int(start.x + (end.x - start.x) * t),
+                        int(start.y + (end.y - start.y) * t),
+                        int(start.width + (end.width - start.width) * t),
+                        int(start.height + (end.height - start.height) * t),
+                    )
+                    if rect != last:
+                        moves.append((hwnd, rect, offsets))
+                        job[4] = rect
+                    if frame + 1 >= steps:
+                        del active[hwnd]
+                    else:
+                        job[3] = frame + 1
+                # Applied under the lock, so cancel() can't be overtaken by
+                # a frame computed before it
+                if moves:
+                    try:
+                        self.apply_positions(moves)
+                    except Exception as e:
+                        logger.debug("Animation frame failed: %s", e)
+                if not active:
+                    continue
+
+            # Ticks are scheduled against a fixed start, so the moves' own
+            # cost doesn't stretch the animation the way a flat sleep does
+            next_tick += self.config.animation_duration_ms / 1000.0 / steps
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
 
     def _ease_out_cubic(self, t: float) -> float:
         return 1 - pow(1 - t, 3)
 
     def _apply_position(self, hwnd: int, rect: Rect, offsets: Tuple[int, int, int, int]) -> None:
         off_l, off_t, off_r, off_b = offsets
-        win32gui.MoveWindow(
+        if not _user32.MoveWindow(
             hwnd,
             rect.x - off_l,
             rect.y - off_t,
             rect.width + off_l + off_r,
             rect.height + off_b,
             True,
-        )
+        ):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def apply_positions(self, moves: List[Tuple[int, Rect, Tuple[int, int, int, int]]]) -> None:
+        """
+        Move several windows as one layout change (DeferWindowPos), so
+        DWM composes a single frame instead of one per window.
+        moves: [(hwnd, rect, offsets)]
+        """
+        user32 = _user32
+        flags = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+        hdwp = user32.BeginDeferWindowPos(len(moves))
+        for hwnd, rect, offsets in moves:
+            if hdwp:
+                off_l, off_t, off_r, off_b = offsets
+                hdwp = user32.DeferWindowPos(
+                    hdwp, hwnd, None,
+                    rect.x - off_l,
+                    rect.y - off_t,
+                    rect.width + off_l + off_r,
+                    rect.height + off_b,
+                    flags,
+                )
+            if not hdwp:
+                # The batch is gone (e.g. a window we can't move), and with it
+                # every move deferred so far: replay all of them one by one
+                logger.debug("DeferWindowPos failed, moving windows individually")
+                for hwnd, rect, offsets in moves:
+                    try:
+                        self._apply_position(hwnd, rect, offsets)
+                    except Exception as e:
+                        logger.debug("Could not move window %s: %s", hwnd, e)
+                return
+        user32.EndDeferWindowPos(hdwp)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # HISTORY MANAGER (Undo/Redo)
@@ -458,26 +796,33 @@ class HistoryManager:
     """Track window position history for undo/redo"""
 
     def __init__(self, max_size: int = 50):
-        self._history: Dict[int, deque] = {}  # hwnd -> deque of WindowState
+        # hwnd -> deque of (x, y, width, height, timestamp); the bounded deque
+        # is the ring buffer, plain tuples keep each entry small
+        self._history: Dict[int, deque] = {}
         self._max_size = max_size
 
-    def save_state(self, hwnd: int) -> None:
-        """Save current window state"""
-        info = WindowUtils.get_window_info(hwnd)
-        if not info:
-            return
+    def save_state(self, hwnd: int, rect: Optional[Rect] = None) -> None:
+        """
+        Save current window state. `rect` overrides the live position, e.g.
+        with the target of an animation that is still running.
+        """
+        if rect is None:
+            info = WindowUtils.get_window_info(hwnd)
+            if not info:
+                return
+            rect = info.rect
         if hwnd not in self._history:
             self._history[hwnd] = deque(maxlen=self._max_size)
-        state = WindowState(hwnd=hwnd, rect=info.rect)
-        self._history[hwnd].append(state)
-        logger.debug(f"Saved state for {hwnd}: {state.rect}")
+        self._history[hwnd].append(rect.to_tuple() + (time.time(),))
+        logger.debug("Saved state for %s: %s", hwnd, rect)
 
     def get_previous_state(self, hwnd: int) -> Optional[WindowState]:
         """Get previous state (for undo)"""
         if hwnd not in self._history or len(self._history[hwnd]) < 2:
             return None
         self._history[hwnd].pop()  # Remove current
-        return self._history[hwnd][-1]  # Return previous
+        x, y, w, h, ts = self._history[hwnd][-1]  # Previous
+        return WindowState(hwnd=hwnd, rect=Rect(x, y, w, h), timestamp=ts)
 
     def clear(self, hwnd: Optional[int] = None) -> None:
         """Clear history"""
@@ -498,10 +843,17 @@ class SavedLayout:
 
 class LayoutStore:
     """Save and restore window layouts"""
-    def __init__(self, path: str = "layouts.json"):
+    def __init__(self, path: str = "layouts.json", animation_engine: Optional["AnimationEngine"] = None):
         self.path = Path(path)
+        # Applies restored positions as one DeferWindowPos batch
+        self.animation_engine = animation_engine or AnimationEngine(Config())
         self._layouts: Dict[str, SavedLayout] = {}
         self._load()
+        # Writes happen on a daemon thread; bursts of changes coalesce
+        self._save_event = threading.Event()
+        self._write_lock = threading.Lock()
+        threading.Thread(target=self._writer, daemon=True).start()
+        atexit.register(self.flush)
 
     def _load(self) -> None:
         try:
@@ -518,20 +870,38 @@ class LayoutStore:
                             timestamp=layout_data.get("timestamp", 0),
                         )
         except Exception as e:
-            logger.error(f"Failed to load layouts: {e}")
+            logger.error("Failed to load layouts: %s", e)
 
     def _save(self) -> None:
+        """Schedule a write; returns immediately"""
+        self._save_event.set()
+
+    def _writer(self) -> None:
+        while True:
+            self._save_event.wait()
+            time.sleep(0.1)  # Let a burst of save/delete calls settle
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes now (also runs at exit)"""
+        with self._write_lock:
+            if not self._save_event.is_set():
+                return
+            self._save_event.clear()
+            self._write()
+
+    def _write(self) -> None:
         try:
             data = {}
-            for name, layout in self._layouts.items():
+            for name, layout in list(self._layouts.items()):
                 data[name] = {
-                    "windows": {k: v.__dict__ for k, v in layout.windows.items()},
+                    "windows": {k: asdict(v) for k, v in layout.windows.items()},
                     "timestamp": layout.timestamp,
                 }
             with open(self.path, "w") as f:
                 json.dump(data, f, indent=2)
         except Exception as e:
-            logger.error(f"Failed to save layouts: {e}")
+            logger.error("Failed to save layouts: %s", e)
 
     def save_current(self, name: str) -> None:
         """Save current window arrangement"""
@@ -542,29 +912,31 @@ class LayoutStore:
                              w.title[:50]: w.rect for w in windows})
         self._layouts[name] = layout
         self._save()
-        logger.info(f"Saved layout '{name}' with {len(windows)} windows")
+        logger.info("Saved layout '%s' with %s windows", name, len(windows))
 
     def restore(self, name: str) -> bool:
         """Restore a saved layout"""
         if name not in self._layouts:
-            logger.warning(f"Layout '{name}' not found")
+            logger.warning("Layout '%s' not found", name)
             return False
         layout = self._layouts[name]
-        current_windows = WindowUtils.enumerate_windows()
+        # Only windows whose title is in the layout get a full WindowInfo.
+        # Minimized windows were never saved, so they aren't restored either.
+        current_windows = WindowUtils.enumerate_windows(
+            lambda w: not w.is_minimized,
+            prefilter=lambda hwnd: win32gui.GetWindowText(hwnd)[:50] in layout.windows,
+        )
+        moves = []
         for window in current_windows:
-            title_key = window.title[:50]
-            if title_key in layout.windows:
-                rect = layout.windows[title_key]
+            rect = layout.windows.get(window.title[:50])  # Title may have just changed
+            if rect is not None:
                 offsets = WindowUtils.get_extended_frame_offsets(window.hwnd)
-                win32gui.MoveWindow(
-                    window.hwnd,
-                    rect.x - offsets[0],
-                    rect.y,
-                    rect.width + offsets[0] + offsets[2],
-                    rect.height + offsets[3],
-                    True,
-                )
-        logger.info(f"Restored layout '{name}'")
+                moves.append((window.hwnd, rect, offsets))
+        if moves:
+            self.animation_engine.apply_positions(moves)
+        for hwnd, _, _ in moves:
+            WindowUtils.invalidate(hwnd)  # May have changed monitor
+        logger.info("Restored layout '%s'", name)
         return True
 
     def list_layouts(self) -> List[str]:
@@ -584,13 +956,32 @@ class LayoutStore:
 class WindowManager:
     """Enhanced Window Manager with all features"""
 
+    STATIC_INFO_TTL = 0.5  # seconds
+    STATIC_INFO_MAX = 256
+
+    # tile_legacy mode names, built once
+    _LEGACY_MODES: Dict[str, TileMode] = {
+        "left": TileMode.LEFT_HALF,
+        "right": TileMode.RIGHT_HALF,
+        "top": TileMode.TOP_HALF,
+        "bottom": TileMode.BOTTOM_HALF,
+        "full": TileMode.MAXIMIZE,
+        "center": TileMode.CENTER,
+    }
+
     def __init__(self, config: Optional[Config] = None):
         self.config = config or Config.load()
         self.monitor_manager = MonitorManager()
         self.layout_calculator = LayoutCalculator(self.config)
         self.animation_engine = AnimationEngine(self.config)
         self.history = HistoryManager(self.config.history_size)
-        self.layout_store = LayoutStore()
+        self.layout_store = LayoutStore(animation_engine=self.animation_engine)
+        # hwnd -> ((class name, is tool/child), monotonic time)
+        self._static_info: Dict[int, Tuple[Tuple[str, bool], float]] = {}
+        # Window order for focus_next_window, kept while the foreground window
+        # is still the one it focused last
+        self._focus_ring: List[int] = []
+        self._focus_ring_last: Optional[int] = None
         logger.info("WindowManager initialized")
 
     # ──────────────────────────────────────────────────────────────────────────
@@ -600,33 +991,68 @@ class WindowManager:
     def _get_valid_hwnd(self, hwnd: Optional[int] = None) -> Optional[int]:
         """Get and validate window handle"""
         hwnd = hwnd or win32gui.GetForegroundWindow()
-        if not win32gui.IsWindow(hwnd) or not win32gui.IsWindowVisible(hwnd):
-            logger.debug(f"Invalid or invisible window: {hwnd}")
+        if not win32gui.IsWindow(hwnd):
+            self._static_info.pop(hwnd, None)
+            _class_cache.pop(hwnd, None)
+            logger.debug("Invalid or invisible window: %s", hwnd)
             return None
-        style = win32api.GetWindowLong(hwnd, win32con.GWL_STYLE)
-        ex_style = win32api.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+        if not win32gui.IsWindowVisible(hwnd):
+            logger.debug("Invalid or invisible window: %s", hwnd)
+            return None
+        class_name, is_tool_or_child = self._window_static_info(hwnd)
         # Filter tool windows and child windows
-        if (ex_style & win32con.WS_EX_TOOLWINDOW) or (style & win32con.WS_CHILD):
-            logger.debug(f"Filtered tool/child window: {hwnd}")
+        if is_tool_or_child:
+            logger.debug("Filtered tool/child window: %s", hwnd)
             return None
         # Filter by class name
-        class_name = win32gui.GetClassName(hwnd)
         if class_name in self.config.excluded_classes:
-            logger.debug(f"Filtered by class: {class_name}")
+            logger.debug("Filtered by class: %s", class_name)
             return None
         # Filter by title
         title = win32gui.GetWindowText(hwnd)
         if title in self.config.excluded_titles:
-            logger.debug(f"Filtered by title: {title}")
+            logger.debug("Filtered by title: %s", title)
             return None
         return hwnd
 
+    def _window_static_info(self, hwnd: int) -> Tuple[str, bool]:
+        """
+        (class name, is tool/child window) for hwnd. These rarely change in a
+        window's life, so repeated commands on one window reuse them briefly.
+        """
+        now = time.monotonic()
+        cached = self._static_info.get(hwnd)
+        if cached and now - cached[1] < self.STATIC_INFO_TTL:
+            return cached[0]
+
+        style = win32api.GetWindowLong(hwnd, win32con.GWL_STYLE)
+        ex_style = win32api.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+        info = (
+            _get_class_name(hwnd),
+            bool((ex_style & win32con.WS_EX_TOOLWINDOW) or (style & win32con.WS_CHILD)),
+        )
+        if len(self._static_info) >= self.STATIC_INFO_MAX:
+            self._static_info = {
+                h: entry for h, entry in self._static_info.items()
+                if now - entry[1] < self.STATIC_INFO_TTL
+            }
+        self._static_info[hwnd] = (info, now)
+        return info
+
     def _prepare_window(self, hwnd: int) -> None:
         """Prepare window for repositioning (restore if maximized)"""
-        placement = win32gui.GetWindowPlacement(hwnd)
-        if placement[1] == win32con.SW_SHOWMAXIMIZED:
+        # IsZoomed is a plain state read; most windows aren't maximized
+        if _user32.IsZoomed(hwnd):
+            # Synchronous on purpose: an async restore could land after the
+            # move and undo it
             win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-            time.sleep(0.05)
+            # A maximized window's borders differ from a restored one's
+            WindowUtils.invalidate(hwnd)
+            # Wait for the restore to land instead of a blind 50ms (same bound)
+            for _ in range(10):
+                if not _user32.IsZoomed(hwnd):
+                    break
+                time.sleep(0.005)
 
     # ──────────────────────────────────────────────────────────────────────────
     # CORE TILING
@@ -638,8 +1064,8 @@ class WindowManager:
         if not hwnd:
             logger.warning("No valid window to tile")
             return False
-        # Save state for undo
-        self.history.save_state(hwnd)
+        # Save state for undo (mid-animation: where the window is headed)
+        self.history.save_state(hwnd, self.animation_engine.pending_target(hwnd))
         # Get monitor and calculate layout
         monitor = self.monitor_manager.get_monitor_for_window(hwnd)
         if not monitor:
@@ -651,7 +1077,7 @@ class WindowManager:
         offsets = WindowUtils.get_extended_frame_offsets(hwnd)
         current_rect = WindowUtils.get_window_info(hwnd).rect
         self.animation_engine.animate(hwnd, current_rect, target_rect, offsets)
-        logger.info(f"Tiled window {hwnd} to {mode.name}")
+        logger.info("Tiled window %s to %s", hwnd, mode.name)
         return True
 
     # ──────────────────────────────────────────────────────────────────────────
@@ -663,7 +1089,7 @@ class WindowManager:
         hwnd = self._get_valid_hwnd(hwnd)
         if not hwnd:
             return False
-        self.history.save_state(hwnd)
+        self.history.save_state(hwnd, self.animation_engine.pending_target(hwnd))
         monitor = self.monitor_manager.get_monitor_for_window(hwnd)
         if not monitor:
             return False
@@ -674,7 +1100,7 @@ class WindowManager:
         offsets = WindowUtils.get_extended_frame_offsets(hwnd)
         current_rect = WindowUtils.get_window_info(hwnd).rect
         self.animation_engine.animate(hwnd, current_rect, target_rect, offsets)
-        logger.info(f"Placed window in grid [{row},{col}] of {rows}x{cols}")
+        logger.info("Placed window in grid [%s,%s] of %sx%s", row, col, rows, cols)
         return True
 
     def grid_top_left(self) -> bool:
@@ -705,7 +1131,7 @@ class WindowManager:
         hwnd = self._get_valid_hwnd(hwnd)
         if not hwnd:
             return False
-        self.history.save_state(hwnd)
+        self.history.save_state(hwnd, self.animation_engine.pending_target(hwnd))
         current_monitor = self.monitor_manager.get_monitor_for_window(hwnd)
         if not current_monitor:
             return False
@@ -739,7 +1165,9 @@ class WindowManager:
         self._prepare_window(hwnd)
         offsets = WindowUtils.get_extended_frame_offsets(hwnd)
         self.animation_engine.animate(hwnd, info.rect, new_rect, offsets)
-        logger.info(f"Moved window to {direction} monitor")
+        # The new monitor may have a different DPI, hence different borders
+        WindowUtils.invalidate(hwnd)
+        logger.info("Moved window to %s monitor", direction)
         return True
 
     def move_to_next_monitor(self) -> bool:
@@ -752,11 +1180,21 @@ class WindowManager:
     # MULTI-WINDOW OPERATIONS
     # ──────────────────────────────────────────────────────────────────────────
 
+    def _not_excluded_class(self, hwnd: int) -> bool:
+        """Cheap enumerate_windows prefilter: class name lookup per hwnd"""
+        return _get_class_name(hwnd) not in self.config.excluded_classes
+
+    def _prepare_move(self, target: Tuple[int, Rect]) -> Tuple[int, Rect, Tuple[int, int, int, int]]:
+        """(hwnd, rect) -> (hwnd, rect, offsets) once the window is ready to move"""
+        hwnd, rect = target
+        self._prepare_window(hwnd)
+        return hwnd, rect, WindowUtils.get_extended_frame_offsets(hwnd)
+
     def tile_all_visible(self, layout: str = "grid") -> bool:
         """Tile all visible windows"""
         windows = WindowUtils.enumerate_windows(
-            lambda w: not w.is_minimized
-            and w.class_name not in self.config.excluded_classes
+            lambda w: not w.is_minimized,
+            prefilter=self._not_excluded_class,
         )
         if not windows:
             return False
@@ -764,39 +1202,33 @@ class WindowManager:
         if not monitor:
             return False
         n = len(windows)
+        targets = []
         if layout == "grid":
             cols = int(n**0.5) + (1 if n**0.5 % 1 else 0)
             rows = (n + cols - 1) // cols
-            for i, window in enumerate(windows):
-                row = i // cols
-                col = i % cols
-                target = self.layout_calculator.calculate_grid(
-                    row, col, rows, cols, monitor.work_area
-                )
-                self._prepare_window(window.hwnd)
-                offsets = WindowUtils.get_extended_frame_offsets(window.hwnd)
-                self.animation_engine._apply_position(
-                    window.hwnd, target, offsets)
+            cells = self.layout_calculator.calculate_grid_all(rows, cols, monitor.work_area)
+            targets = [(window.hwnd, cell) for window, cell in zip(windows, cells)]
         elif layout == "cascade":
             offset = 30
-            base_rect = Rect(
-                monitor.work_area.x + self.config.margin,
-                monitor.work_area.y + self.config.margin,
-                int(monitor.work_area.width * 0.6),
-                int(monitor.work_area.height * 0.6),
-            )
-            for i, window in enumerate(windows):
-                target = Rect(
-                    base_rect.x + i * offset,
-                    base_rect.y + i * offset,
-                    base_rect.width,
-                    base_rect.height,
-                )
-                self._prepare_window(window.hwnd)
-                offsets = WindowUtils.get_extended_frame_offsets(window.hwnd)
-                self.animation_engine._apply_position(
-                    window.hwnd, target, offsets)
-        logger.info(f"Tiled {n} windows using {layout} layout")
+            work_area = monitor.work_area
+            x = work_area.x + self.config.margin
+            y = work_area.y + self.config.margin
+            w = int(work_area.width * 0.6)
+            h = int(work_area.height * 0.6)
+            targets = [
+                (window.hwnd, Rect(x + i * offset, y + i * offset, w, h))
+                for i, window in enumerate(windows)
+            ]
+        if not targets:
+            return False
+        # Restores and DWM queries are per-window round trips that wait on
+        # other processes: overlap them, then apply all moves in one batch
+        with ThreadPoolExecutor(max_workers=min(8, len(targets))) as pool:
+            moves = list(pool.map(self._prepare_move, targets))
+        self.animation_engine.apply_positions(moves)
+        for hwnd, _, _ in moves:
+            WindowUtils.invalidate(hwnd)  # May have changed monitor
+        logger.info("Tiled %s windows using %s layout", n, layout)
         return True
 
     # ──────────────────────────────────────────────────────────────────────────
@@ -813,6 +1245,8 @@ class WindowManager:
             logger.warning("No previous state to restore")
             return False
         offsets = WindowUtils.get_extended_frame_offsets(hwnd)
+        # A still-running tile animation would otherwise move it right back
+        self.animation_engine.cancel(hwnd)
         self.animation_engine._apply_position(hwnd, prev_state.rect, offsets)
         logger.info("Restored previous window position")
         return True
@@ -843,24 +1277,38 @@ class WindowManager:
         windows = WindowUtils.enumerate_windows(
             lambda w: w.hwnd != current and not w.is_minimized
         )
+        # Posted, not sent: a hung app can't stall the rest of the loop
         for window in windows:
-            win32gui.ShowWindow(window.hwnd, win32con.SW_MINIMIZE)
-        logger.info(f"Minimized {len(windows)} windows")
+            _user32.ShowWindowAsync(window.hwnd, win32con.SW_MINIMIZE)
+        logger.info("Minimized %s windows", len(windows))
         return True
 
     def focus_next_window(self) -> bool:
-        """Focus the next window"""
+        """
+        Focus the next window. Repeated presses walk the whole z-order taken
+        at the first one; focusing a window any other way starts over.
+        """
         current = win32gui.GetForegroundWindow()
-        windows = WindowUtils.enumerate_windows(
-            lambda w: not w.is_minimized
-            and w.class_name not in self.config.excluded_classes
-        )
-        if len(windows) < 2:
+        if current != self._focus_ring_last or not self._focus_ring:
+            windows = WindowUtils.enumerate_windows(
+                lambda w: not w.is_minimized,
+                prefilter=self._not_excluded_class,
+            )
+            self._focus_ring = [w.hwnd for w in windows]
+        else:
+            # Reusing the order: drop windows closed since it was taken
+            self._focus_ring = [h for h in self._focus_ring if win32gui.IsWindow(h)]
+        ring = self._focus_ring
+        if len(ring) < 2:
+            self._focus_ring_last = None
+            return False
+        current_idx = ring.index(current) if current in ring else -1
+        target = ring[(current_idx + 1) % len(ring)]
+        if not WindowUtils.focus_window(target):
+            self._focus_ring_last = None
             return False
-        current_idx = next(
-            (i for i, w in enumerate(windows) if w.hwnd == current), -1)
-        next_idx = (current_idx + 1) % len(windows)
-        return WindowUtils.focus_window(windows[next_idx].hwnd)
+        self._focus_ring_last = target
+        return True
 
     # ──────────────────────────────────────────────────────────────────────────
     # LAYOUT PRESETS
@@ -884,20 +1332,13 @@ class WindowManager:
 
     def tile_legacy(self, mode: str) -> bool:
         """Legacy tile method for backward compatibility"""
-        mode_map = {
-            "left": TileMode.LEFT_HALF,
-            "right": TileMode.RIGHT_HALF,
-            "top": TileMode.TOP_HALF,
-            "bottom": TileMode.BOTTOM_HALF,
-            "full": TileMode.MAXIMIZE,
-            "center": TileMode.CENTER,
-        }
-        if mode in mode_map:
-            return self.tile(mode_map[mode])
+        tile_mode = self._LEGACY_MODES.get(mode)
+        if tile_mode is not None:
+            return self.tile(tile_mode)
         return False
 
 # ══════════════════════════════════════════════════════════════════════════════
-# KEYBOARD INTEGRATION (Optional - requires `keyboard` package)
+# KEYBOARD INTEGRATION (RegisterHotKey; `keyboard` only for combos it can't express)
 # ══════════════════════════════════════════════════════════════════════════════
 
 class HotkeyManager:
@@ -906,31 +1347,77 @@ class HotkeyManager:
         self.wm = wm
         self._hotkeys = {}
         self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id: Optional[int] = None
+        self._hooked = False  # Some combos fell back to the keyboard hook
 
     def register(self, hotkey: str, action: Callable) -> None:
         """Register a hotkey"""
         self._hotkeys[hotkey] = action
 
     def start(self) -> None:
-        """Start listening for hotkeys (requires keyboard package)"""
+        """Start listening for hotkeys on a background message loop"""
+        if self._running:
+            return
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._loop, args=(dict(self._hotkeys), ready), name="wm-hotkeys", daemon=True
+        )
+        self._thread.start()
+        ready.wait(timeout=2)
+        self._running = True
+        logger.info("Registered %s hotkeys", len(self._hotkeys))
+
+    def _loop(self, hotkeys: Dict[str, Callable], ready: threading.Event) -> None:
+        """
+        Registers the hotkeys on this thread and pumps WM_HOTKEY. The OS only
+        wakes us for matching combos - no per-keystroke Python hook.
+        """
+        from core.hotkeys import MOD_NOREPEAT, WM_HOTKEY, parse_hotkey
+
+        self._thread_id = threading.get_native_id()
+        table = {}  # hotkey id -> action
+        for hotkey_id, (hotkey, action) in enumerate(hotkeys.items(), start=1):
+            parsed = parse_hotkey(hotkey)
+            # hwnd=None binds the hotkey to this thread's message queue
+            if parsed and _user32.RegisterHotKey(None, hotkey_id, parsed[0] | MOD_NOREPEAT, parsed[1]):
+                table[hotkey_id] = action
+            else:
+                self._hook_hotkey(hotkey, action)
+        ready.set()
+
+        msg = wintypes.MSG()
+        while _user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            if msg.message == WM_HOTKEY:
+                action = table.get(msg.wParam)
+                if action is not None:
+                    # One failing action must not take the loop down with it
+                    try:
+                        action()
+                    except Exception:
+                        logger.exception("Hotkey action failed")
+        for hotkey_id in table:
+            _user32.UnregisterHotKey(None, hotkey_id)
+
+    def _hook_hotkey(self, hotkey: str, action: Callable) -> None:
+        """Fallback for unsupported key names or combos another app already owns"""
         try:
             import keyboard
-            for hotkey, action in self._hotkeys.items():
-                keyboard.add_hotkey(hotkey, action)
-            self._running = True
-            logger.info(f"Registered {len(self._hotkeys)} hotkeys")
+            keyboard.add_hotkey(hotkey, action)
+            self._hooked = True
         except ImportError:
-            logger.warning(
-                "keyboard package not installed. Run: pip install keyboard")
+            logger.warning("Could not register %r (keyboard package not installed)", hotkey)
 
     def stop(self) -> None:
         """Stop listening"""
-        try:
+        if self._thread_id is not None:
+            _user32.PostThreadMessageW(self._thread_id, win32con.WM_QUIT, 0, 0)
+            self._thread_id = None
+        if self._hooked:
             import keyboard
             keyboard.unhook_all()
-            self._running = False
-        except ImportError:
-            pass
+            self._hooked = False
+        self._running = False
 
 # ══════════════════════════════════════════════════════════════════════════════
 # EXAMPLE USAGE
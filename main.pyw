@@ -7,7 +7,7 @@ import keyboard
 
 # PyQt6 Imports
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QObject, pyqtSignal # Required for thread safety
+from PyQt6.QtCore import Qt, QObject, pyqtSignal # Required for thread safety
 
 # Core Imports
 from core.window_manager import WindowManager, TileMode
@@ -59,6 +59,8 @@ def load_config():
         return {"theme": {"font": "Segoe UI", "font_size": 20, "width": 640}}
 
 def main():
+    # Never promote parents to native windows (e.g. if a child asks for winId())
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetAncestors, True)
     qt_app = QApplication(sys.argv)
     qt_app.setQuitOnLastWindowClosed(False)
 